@@ -1,16 +1,99 @@
-"""Audio processing using pydub."""
+"""Audio processing using ffmpeg and pydub."""
 
+import audioop
 import logging
+import struct
+import subprocess
+import wave
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
-from .models import ChunkData, Config
+from .models import ChunkData, Config, PCMAudio
 
 logger = logging.getLogger(__name__)
 
+# Canonical 44-byte PCM WAV header, compiled once since one is built per chunk
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def build_wav_header(data_size: int, sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for uncompressed PCM data.
+    
+    Args:
+        data_size: Size of the PCM payload in bytes
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+        sample_width: Bytes per sample
+        
+    Returns:
+        WAV header bytes
+    """
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size,
+    )
+
+
+def parse_wav_bytes(data: bytes) -> PCMAudio:
+    """Extract PCM samples and format from an in-memory WAV stream.
+    
+    ffmpeg cannot seek back to fill in chunk sizes when writing to a pipe, so
+    a placeholder data size is treated as "until the end of the stream".
+    
+    Args:
+        data: WAV file contents
+        
+    Returns:
+        PCMAudio with the decoded samples
+        
+    Raises:
+        CouldntDecodeError: If the data is not a 16-bit PCM WAV stream
+    """
+    if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise CouldntDecodeError("Decoder output is not a WAV stream")
+    
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        chunk_size = int.from_bytes(data[pos + 4:pos + 8], 'little')
+        body_start = pos + 8
+        
+        if chunk_id == b'fmt ':
+            fmt = struct.unpack_from('<HHIIHH', data, body_start)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise CouldntDecodeError("WAV stream has no format chunk before its data")
+            audio_format, channels, sample_rate, _, _, bits_per_sample = fmt
+            if audio_format not in (1, 0xFFFE) or bits_per_sample != 16:
+                raise CouldntDecodeError(f"Unsupported WAV encoding: format {audio_format}, {bits_per_sample} bits")
+            
+            data_end = body_start + chunk_size
+            if chunk_size in (0, 0xFFFFFFFF) or data_end > len(data):
+                data_end = len(data)
+            
+            # Drop any trailing partial frame
+            frame_width = channels * 2
+            data_end -= (data_end - body_start) % frame_width
+            
+            return PCMAudio(
+                data=data[body_start:data_end],
+                sample_rate=sample_rate,
+                channels=channels,
+                sample_width=2
+            )
+        
+        # Chunks are padded to an even size
+        pos = body_start + chunk_size + (chunk_size & 1)
+    
+    raise CouldntDecodeError("WAV stream has no data chunk")
+
 
 class AudioProcessor:
     """Handles audio file processing and chunking."""
@@ -18,14 +101,14 @@ class AudioProcessor:
     def __init__(self, config: Config):
         self.config = config
     
-    def load_audio(self, file_path: Path) -> AudioSegment:
-        """Load audio file and return AudioSegment.
+    def load_audio(self, file_path: Path) -> PCMAudio:
+        """Load audio file and decode it to raw PCM.
         
         Args:
             file_path: Path to the audio file
             
         Returns:
-            AudioSegment object
+            PCMAudio object
             
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -43,55 +126,160 @@ class AudioProcessor:
                 f"Supported formats: {', '.join(self.config.supported_formats)}"
             )
         
+        logger.info(f"Loading audio file: {file_path}")
+        audio = self._decode(file_path)
+        logger.info(f"Audio loaded: {audio.duration_seconds:.2f}s duration, {audio.sample_rate}Hz sample rate")
+        return audio
+    
+    def _decode(self, file_path: Path) -> PCMAudio:
+        """Decode an audio file, reading plain WAV files in-process when possible.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            PCMAudio with the decoded samples
+        """
+        if file_path.suffix.lower() == '.wav':
+            pcm = self._read_wav(file_path)
+            if pcm is not None:
+                return pcm
+        
+        return self._decode_with_ffmpeg(file_path)
+    
+    def _read_wav(self, file_path: Path) -> Optional[PCMAudio]:
+        """Read an integer PCM WAV file with the standard library, skipping ffmpeg.
+        
+        Only sample width conversion and stereo-to-mono mixdown are done here;
+        files that need resampling go through ffmpeg, whose resampler filters
+        properly instead of interpolating.
+        
+        Args:
+            file_path: Path to the WAV file
+            
+        Returns:
+            PCMAudio with 16-bit samples, or None if ffmpeg should decode the file
+        """
+        target_rate = self.config.audio_sample_rate
+        target_channels = self.config.audio_channels
+        
+        try:
+            with wave.open(str(file_path), 'rb') as wav_file:
+                channels = wav_file.getnchannels()
+                sample_width = wav_file.getsampwidth()
+                sample_rate = wav_file.getframerate()
+                
+                if target_rate is not None and target_rate != sample_rate:
+                    return None
+                mixdown = target_channels is not None and target_channels != channels
+                if mixdown and not (channels == 2 and target_channels == 1):
+                    return None
+                
+                data = wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError) as e:
+            # e.g. float or compressed WAV, which ffmpeg handles
+            logger.debug(f"Falling back to ffmpeg for {file_path}: {e}")
+            return None
+        
+        # 8-bit WAV samples are unsigned, wider ones signed
+        if sample_width == 1:
+            data = audioop.bias(data, 1, -128)
+        if sample_width != 2:
+            data = audioop.lin2lin(data, sample_width, 2)
+        if mixdown:
+            data = audioop.tomono(data, 2, 0.5, 0.5)
+            channels = 1
+        
+        return PCMAudio(data=data, sample_rate=sample_rate, channels=channels, sample_width=2)
+    
+    def _decode_with_ffmpeg(self, file_path: Path) -> PCMAudio:
+        """Decode an audio file to 16-bit PCM by piping ffmpeg's output into memory.
+        
+        Resampling and channel mixdown happen inside ffmpeg, so speech models
+        receive e.g. 16 kHz mono instead of the often much larger source format.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            PCMAudio with the decoded samples
+            
+        Raises:
+            CouldntDecodeError: If ffmpeg fails to decode the file
+            RuntimeError: If ffmpeg is not installed
+        """
+        command = [
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-i", str(file_path),
+            "-vn", "-f", "wav", "-acodec", "pcm_s16le",
+        ]
+        if self.config.audio_channels is not None:
+            command += ["-ac", str(self.config.audio_channels)]
+        if self.config.audio_sample_rate is not None:
+            command += ["-ar", str(self.config.audio_sample_rate)]
+        command.append("pipe:1")
+        
         try:
-            logger.info(f"Loading audio file: {file_path}")
-            audio = AudioSegment.from_file(str(file_path))
-            logger.info(f"Audio loaded: {len(audio) / 1000:.2f}s duration, {audio.frame_rate}Hz sample rate")
-            return audio
-        except CouldntDecodeError as e:
-            raise CouldntDecodeError(f"Could not decode audio file {file_path}: {e}")
+            process = subprocess.run(command, capture_output=True)
+        except FileNotFoundError as e:
+            raise RuntimeError("ffmpeg is required to decode audio but was not found in PATH") from e
+        
+        if process.returncode != 0:
+            error_output = process.stderr.decode('utf-8', errors='replace').strip()
+            raise CouldntDecodeError(f"Could not decode audio file {file_path}: {error_output}")
+        
+        return parse_wav_bytes(process.stdout)
     
-    def create_chunks(self, audio: AudioSegment) -> List[ChunkData]:
+    def create_chunks(self, audio: PCMAudio) -> List[ChunkData]:
         """Split audio into overlapping chunks.
         
+        Chunks reference byte ranges of the shared PCM data instead of holding
+        their own copy of the audio.
+        
         Args:
-            audio: AudioSegment to split
+            audio: PCMAudio to split
             
         Returns:
             List of ChunkData objects
         """
         chunks = []
+        frame_width = audio.frame_width
         
         # Convert durations to milliseconds
         chunk_duration_ms = self.config.chunk_duration_minutes * 60 * 1000
         overlap_duration_ms = self.config.overlap_duration_minutes * 60 * 1000
         step_size_ms = chunk_duration_ms - overlap_duration_ms
         
-        total_duration_ms = len(audio)
+        total_duration_ms = round(audio.frame_count * 1000 / audio.sample_rate)
         
         logger.info(f"Creating chunks: {chunk_duration_ms / 1000:.0f}s chunks with {overlap_duration_ms / 1000:.0f}s overlap")
         
         chunk_index = 0
         start_time_ms = 0
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         while start_time_ms < total_duration_ms:
             # Calculate end time for this chunk
             end_time_ms = min(start_time_ms + chunk_duration_ms, total_duration_ms)
             
-            # Extract audio segment for this chunk
-            chunk_audio = audio[start_time_ms:end_time_ms]
+            # Locate the chunk in the PCM data, aligned to whole frames
+            start_byte = start_time_ms * audio.sample_rate // 1000 * frame_width
+            end_byte = min(end_time_ms * audio.sample_rate // 1000 * frame_width, len(audio.data))
             
             # Create ChunkData object
             chunk_data = ChunkData(
                 start_time_seconds=start_time_ms / 1000,
                 end_time_seconds=end_time_ms / 1000,
                 chunk_index=chunk_index,
-                audio_segment=chunk_audio
+                audio=audio,
+                start_byte=start_byte,
+                end_byte=end_byte
             )
             
             chunks.append(chunk_data)
             
-            logger.debug(f"Created chunk {chunk_index}: {chunk_data.start_time_seconds:.1f}s - {chunk_data.end_time_seconds:.1f}s")
+            if debug_enabled:
+                logger.debug(f"Created chunk {chunk_index}: {chunk_data.start_time_seconds:.1f}s - {chunk_data.end_time_seconds:.1f}s")
             
             # Move to next chunk
             chunk_index += 1
@@ -107,48 +295,68 @@ class AudioProcessor:
     def export_chunk_to_bytes(self, chunk: ChunkData, format: str = "wav") -> bytes:
         """Export audio chunk to bytes.
         
+        WAV output is assembled directly from the shared PCM data, so no
+        encoder runs and the chunk's samples are copied only once.
+        
         Args:
-            chunk: ChunkData with audio segment
+            chunk: ChunkData with audio data
             format: Audio format for export
             
         Returns:
             Audio data as bytes
         """
-        if chunk.audio_segment is None:
-            raise ValueError("ChunkData has no audio segment")
+        if chunk.audio is not None:
+            audio = chunk.audio
+            pcm_view = memoryview(audio.data)[chunk.start_byte:chunk.end_byte]
+            
+            if format == "wav":
+                header = build_wav_header(len(pcm_view), audio.sample_rate, audio.channels, audio.sample_width)
+                return b"".join((header, pcm_view))
+            
+            segment = AudioSegment(
+                data=pcm_view.tobytes(),
+                sample_width=audio.sample_width,
+                frame_rate=audio.sample_rate,
+                channels=audio.channels
+            )
+        elif chunk.audio_segment is not None:
+            segment = chunk.audio_segment
+        else:
+            raise ValueError("ChunkData has no audio data")
         
-        # Export to bytes
-        from io import BytesIO
+        # Other formats go through pydub's encoder
         buffer = BytesIO()
-        chunk.audio_segment.export(buffer, format=format)
+        segment.export(buffer, format=format)
         return buffer.getvalue()
     
-    def get_audio_info(self, audio: AudioSegment) -> dict:
+    def get_audio_info(self, audio: PCMAudio) -> dict:
         """Get information about audio file.
         
+        Everything is derived from the PCM format metadata, so this is O(1).
+        
         Args:
-            audio: AudioSegment to analyze
+            audio: PCMAudio to analyze
             
         Returns:
             Dictionary with audio information
         """
         return {
-            "duration_seconds": len(audio) / 1000,
-            "sample_rate": audio.frame_rate,
+            "duration_seconds": audio.duration_seconds,
+            "sample_rate": audio.sample_rate,
             "channels": audio.channels,
             "sample_width": audio.sample_width,
-            "frame_count": audio.frame_count(),
-            "max_possible_amplitude": audio.max_possible_amplitude
+            "frame_count": audio.frame_count,
+            "max_possible_amplitude": float(1 << (8 * audio.sample_width - 1))
         }
     
-    def process_file(self, file_path: Path) -> tuple[AudioSegment, List[ChunkData]]:
+    def process_file(self, file_path: Path) -> tuple[PCMAudio, List[ChunkData]]:
         """Process audio file and return audio and chunks.
         
         Args:
             file_path: Path to audio file
             
         Returns:
-            Tuple of (AudioSegment, List[ChunkData])
+            Tuple of (PCMAudio, List[ChunkData])
         """
         # Load audio
         audio = self.load_audio(file_path)
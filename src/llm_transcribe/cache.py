@@ -0,0 +1,112 @@
+"""On-disk cache of chunk transcription results."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from . import __version__
+from .models import ChunkData, TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "llm-transcribe"
+
+
+class ResultCache:
+    """Content-addressed store of TranscriptionResults, one JSON file per chunk request.
+    
+    Results are keyed by everything that goes into the LLM request, so a
+    re-run of the same file with the same settings skips the LLM entirely
+    while any change to audio, context or model misses the cache.
+    """
+    
+    def __init__(self, directory: Path):
+        """Create a cache stored in the given directory.
+        
+        Args:
+            directory: Directory for cached results, created on first write
+        """
+        self.directory = directory
+    
+    @staticmethod
+    def make_key(model: str, chunk: ChunkData, audio_bytes: bytes, context: Optional[str] = None, meeting_context: Optional[str] = None, speaker_context: Optional[str] = None) -> str:
+        """Build the cache key for a chunk request.
+        
+        The package version is included because prompts change between releases.
+        
+        Args:
+            model: LLM model the chunk is sent to
+            chunk: ChunkData being transcribed (its position sets absolute timestamps)
+            audio_bytes: Exported chunk audio
+            context: Optional context from previous chunk
+            meeting_context: Optional context about the meeting
+            speaker_context: Optional sample lines of speakers from earlier chunks
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        
+        # NUL separators keep adjacent fields from running into each other
+        fields = (__version__, model, str(chunk.chunk_index), repr(chunk.start_time_seconds), context or "", meeting_context or "", speaker_context or "")
+        for field in fields:
+            digest.update(field.encode('utf-8'))
+            digest.update(b"\0")
+        digest.update(audio_bytes)
+        
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[TranscriptionResult]:
+        """Load a cached result.
+        
+        Args:
+            key: Key from make_key
+        
+        Returns:
+            The cached TranscriptionResult, or None if missing or unreadable
+        """
+        path = self._path(key)
+        try:
+            return TranscriptionResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            # A corrupt entry is just a miss; it gets overwritten after the next LLM call
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+    
+    def put(self, key: str, result: TranscriptionResult) -> None:
+        """Store a result.
+        
+        Failed chunks (results without lines) are not stored, so they are retried next time.
+        
+        Args:
+            key: Key from make_key
+            result: TranscriptionResult to store
+        """
+        if not result.lines:
+            return
+        
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial entry
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(result.model_dump_json(), encoding='utf-8')
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
@@ -18,6 +18,7 @@ from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.prompt import Confirm
 
+from .cache import default_cache_dir
 from .models import Config
 from .output import OutputHandler
 from .transcriber import TranscriptionEngine
@@ -96,6 +97,40 @@ def main(
         "--overlap-duration",
         help="Overlap duration between chunks in minutes"
     ),
+    concurrency: int = typer.Option(
+        1,
+        "-j", "--concurrency",
+        min=1,
+        help="Number of chunks to transcribe in parallel (values above 1 skip previous-chunk context)"
+    ),
+    rpm: Optional[float] = typer.Option(
+        None,
+        "--rpm",
+        min=0.001,
+        help="Maximum LLM requests per minute when transcribing concurrently (default: no limit)"
+    ),
+    upload_audio: bool = typer.Option(
+        False,
+        "--upload-audio",
+        help="Upload chunk audio via the Gemini Files API instead of inlining it in each request"
+    ),
+    speaker_samples: int = typer.Option(
+        0,
+        "--speaker-samples",
+        min=0,
+        help="Send this many earlier lines per speaker with each chunk to keep speaker labels consistent (sequential mode only)"
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Store chunk transcriptions on disk and reuse them when the same chunk is transcribed again"
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        file_okay=False,
+        help="Directory for cached chunk transcriptions (implies --cache; default: ~/.cache/llm-transcribe)"
+    ),
     export_formats: Optional[str] = typer.Option(
         None,
         "--export",
@@ -141,6 +176,22 @@ def main(
     # Update config with command line options
     config.chunk_duration_minutes = chunk_duration
     config.overlap_duration_minutes = overlap_duration
+    config.max_concurrent_chunks = concurrency
+    config.requests_per_minute = rpm
+    config.upload_audio = upload_audio
+    config.speaker_samples = speaker_samples
+    # The result cache keeps transcripts on disk, so it is only used when asked for
+    if cache_dir is not None:
+        config.result_cache_dir = cache_dir
+    elif cache:
+        config.result_cache_dir = default_cache_dir()
+    else:
+        config.result_cache_dir = None
+    
+    # Concurrent chunks are transcribed independently, with no earlier chunks to sample from
+    if speaker_samples > 0 and concurrency > 1:
+        console.print("[red]Error:[/red] --speaker-samples needs sequential processing; use it with -j 1")
+        raise typer.Exit(1)
     
     # Determine output file
     if output is None:
@@ -164,6 +215,12 @@ def main(
     console.print(f"[blue]Model:[/blue] {model}")
     console.print(f"[blue]Chunk Duration:[/blue] {chunk_duration} minutes")
     console.print(f"[blue]Overlap Duration:[/blue] {overlap_duration} minutes")
+    if concurrency > 1:
+        console.print(f"[blue]Concurrency:[/blue] {concurrency} chunks")
+    if rpm:
+        console.print(f"[blue]Rate Limit:[/blue] {rpm:g} requests/minute")
+    if config.result_cache_dir:
+        console.print(f"[blue]Result Cache:[/blue] {config.result_cache_dir}")
     console.print(f"[blue]Export Formats:[/blue] {', '.join(export_format_list)}")
     if context:
         console.print(f"[blue]Context:[/blue] {context}")
@@ -253,8 +310,7 @@ def main(
         
         # Show report file if generated
         if 'report' in export_format_list:
-            report_file = output.with_suffix('.report.txt')
-            console.print(f"[blue]Summary report:[/blue] {report_file}")
+            console.print(f"[blue]Summary report:[/blue] {job.report_file}")
         
         # Show cost summary
         engine.llm_client.print_cost_summary()
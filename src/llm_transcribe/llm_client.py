@@ -1,29 +1,76 @@
 """LLM client using LiteLLM."""
 
-import base64
+import asyncio
+import binascii
+import hashlib
 import logging
+import math
 import re
+import sys
+import threading
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import litellm
 import stamina
-from litellm import completion, completion_cost
+from litellm import acompletion, completion, completion_cost
 
 from .models import ChunkData, TranscriptionLine, TranscriptionResult
-from .timestamp_utils import format_timestamp, parse_timestamp_from_text
+from .ratelimit import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every response line, compiled once at import
+# [MM:SS] Speaker: text, one per line; [^\S\n] is whitespace that doesn't cross lines
+_LINE_RE = re.compile(r'^[^\S\n]*\[(\d{1,2}):(\d{2})\][^\S\n]*([^:\n]+):[^\S\n]*(.*\S)', re.MULTILINE)
+_RELATIVE_TIMESTAMP_RE = re.compile(r'\[(\d{1,2}):(\d{2})\]')  # [MM:SS]
+_ABSOLUTE_TIMESTAMP_RE = re.compile(r'\[(\d{2}):(\d{2}):(\d{2})\]')  # [HH:MM:SS]
+
+# Completion parameters used for every chunk
+_TRANSCRIPTION_PARAMS = {
+    "max_tokens": 16000,  # Generous limit for transcription
+    "temperature": 0.1,  # Low temperature for consistent transcription
+    "reasoning_effort": "low",
+}
+
+# User prompts; only the context and audio payload change between chunks
+_FIRST_CHUNK_PROMPT = "Please transcribe this audio chunk. Start timestamps from [00:00], use [MM:SS] format, and increment naturally."
+_CONTEXT_PROMPT_TEMPLATE = """Context from previous chunk:
+{context}
+
+IMPORTANT INSTRUCTIONS:
+1. First, output the context above EXACTLY as shown (verbatim)
+2. Then, continue transcribing from where the context ends
+3. Maintain speaker consistency throughout
+4. The context helps you understand the conversation flow and speaker identities
+
+Start your output by repeating the context lines exactly, then add new transcription."""
+_SPEAKER_PROMPT_TEMPLATE = """Speakers identified earlier in this recording, with sample lines:
+{speakers}
+
+Use the same speaker labels when these speakers talk again. These samples are for reference only, do not repeat them in your output.
+
+"""
+
 
 class LLMClient:
     """Client for interacting with LLMs via LiteLLM."""
     
-    def __init__(self, model: str = "gemini-2.5-flash"):
+    def __init__(self, model: str = "gemini-2.5-flash", upload_audio: bool = False, requests_per_minute: Optional[float] = None):
         self.model = model
+        self.upload_audio = upload_audio
+        
+        # Files API URIs keyed by a digest of the uploaded audio
+        self._uploaded_files: Dict[bytes, str] = {}
+        
+        # Spaces out concurrent async requests so fan-out doesn't trip provider rate limits
+        self.rate_limiter = AsyncRateLimiter(requests_per_minute) if requests_per_minute else None
         self.total_cost = 0.0
         self.request_count = 0
         
+        # Guards cost/request counters; audio uploads may run in worker threads
+        self._stats_lock = threading.Lock()
+        
         # Define which exceptions should be retried
         self.retryable_exceptions = (
             litellm.RateLimitError,
@@ -118,6 +165,27 @@ Your output should be:
 [01:03] Speaker 2: Which areas specifically? (eager)
 
 If you are provided with context from a previous chunk, use it to maintain speaker consistency and conversation flow."""
+        
+        # System messages are identical for every chunk of a job, so build each variant once
+        self._system_messages: Dict[Optional[str], dict] = {}
+    
+    def _get_system_message(self, meeting_context: Optional[str] = None) -> dict:
+        """Get the (cached) system message, with optional meeting context appended.
+        
+        Args:
+            meeting_context: Optional context about the meeting for better transcription
+            
+        Returns:
+            System message dictionary
+        """
+        message = self._system_messages.get(meeting_context)
+        if message is None:
+            system_content = self.system_message
+            if meeting_context:
+                system_content += f"\n\nAdditional context for this meeting:\n{meeting_context}\n\nUse this context to better understand the conversation and improve transcription accuracy."
+            message = {"role": "system", "content": system_content}
+            self._system_messages[meeting_context] = message
+        return message
     
     def encode_audio_to_base64(self, audio_bytes: bytes) -> str:
         """Encode audio bytes to base64 string.
@@ -128,9 +196,60 @@ If you are provided with context from a previous chunk, use it to maintain speak
         Returns:
             Base64 encoded string
         """
-        return base64.b64encode(audio_bytes).decode('utf-8')
+        # binascii skips b64encode's Python wrapper; ASCII decoding is a plain copy
+        return binascii.b2a_base64(audio_bytes, newline=False).decode('ascii')
+    
+    def upload_audio_file(self, audio_bytes: bytes, filename: str = "chunk.wav") -> str:
+        """Upload audio through the Gemini Files API so requests can reference it.
+        
+        The raw bytes are sent once as multipart form data, avoiding the base64
+        inflation of inline audio on every request that uses the chunk.
+        
+        Args:
+            audio_bytes: Audio data as bytes
+            filename: Name to give the uploaded file
+            
+        Returns:
+            URI of the uploaded file
+        """
+        uploaded = litellm.create_file(
+            file=(filename, audio_bytes, "audio/wav"),
+            purpose="user_data",
+            custom_llm_provider="gemini",
+        )
+        logger.debug(f"Uploaded {len(audio_bytes)} bytes of audio as {uploaded.id}")
+        return uploaded.id
     
-    def create_messages(self, audio_bytes: bytes, chunk_start_seconds: float, context: Optional[str] = None, meeting_context: Optional[str] = None) -> List[dict]:
+    def _get_chunk_file_id(self, chunk: ChunkData, audio_bytes: bytes) -> Optional[str]:
+        """Get the Files API URI for a chunk, uploading its audio on first use.
+        
+        Args:
+            chunk: ChunkData object; the URI is cached on it for later requests
+            audio_bytes: Audio data as bytes
+            
+        Returns:
+            File URI, or None if uploads are disabled or the upload failed
+        """
+        if not self.upload_audio:
+            return None
+        
+        if chunk.uploaded_file_id is None:
+            # Identical audio (e.g. the same file transcribed again) reuses the earlier upload
+            audio_key = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+            file_id = self._uploaded_files.get(audio_key)
+            if file_id is None:
+                try:
+                    file_id = self.upload_audio_file(audio_bytes, f"chunk_{chunk.chunk_index}.wav")
+                except Exception as e:
+                    # Inline base64 still works, it's just a larger request
+                    logger.warning(f"Audio upload failed for chunk {chunk.chunk_index}, sending inline instead: {e}")
+                    return None
+                self._uploaded_files[audio_key] = file_id
+            chunk.uploaded_file_id = file_id
+        
+        return chunk.uploaded_file_id
+    
+    def create_messages(self, audio_bytes: bytes, chunk_start_seconds: float, context: Optional[str] = None, meeting_context: Optional[str] = None, file_id: Optional[str] = None, speaker_context: Optional[str] = None) -> List[dict]:
         """Create message array for LLM API.
         
         Args:
@@ -138,43 +257,33 @@ If you are provided with context from a previous chunk, use it to maintain speak
             chunk_start_seconds: Start time of this chunk in seconds
             context: Optional context from previous chunk
             meeting_context: Optional context about the meeting for better transcription
+            file_id: Optional URI of already uploaded audio, used instead of inline audio_bytes
+            speaker_context: Optional sample lines of speakers from earlier chunks
             
         Returns:
             List of message dictionaries
         """
-        # Create system message with optional meeting context
-        system_content = self.system_message
-        if meeting_context:
-            system_content += f"\n\nAdditional context for this meeting:\n{meeting_context}\n\nUse this context to better understand the conversation and improve transcription accuracy."
-        
-        messages = [
-            {
-                "role": "system",
-                "content": system_content
-            }
-        ]
-        
         # Create the main transcription prompt with relative timing instructions
         if context:
             # Convert context timestamps to be relative to this chunk
             relative_context = self._convert_context_to_relative(context, chunk_start_seconds)
-            transcription_prompt = f"""Context from previous chunk:
-{relative_context}
-
-IMPORTANT INSTRUCTIONS:
-1. First, output the context above EXACTLY as shown (verbatim)
-2. Then, continue transcribing from where the context ends
-3. Maintain speaker consistency throughout
-4. The context helps you understand the conversation flow and speaker identities
-
-Start your output by repeating the context lines exactly, then add new transcription."""
+            transcription_prompt = _CONTEXT_PROMPT_TEMPLATE.format(context=relative_context)
         else:
             # First chunk - normal prompt
-            transcription_prompt = "Please transcribe this audio chunk. Start timestamps from [00:00], use [MM:SS] format, and increment naturally."
+            transcription_prompt = _FIRST_CHUNK_PROMPT
         
-        # Add audio using Gemini's expected format
-        audio_base64 = self.encode_audio_to_base64(audio_bytes)
-        messages.append({
+        # Speaker samples have no timestamps, so they can't be mistaken for context lines
+        if speaker_context:
+            transcription_prompt = _SPEAKER_PROMPT_TEMPLATE.format(speakers=speaker_context) + transcription_prompt
+        
+        # Add audio using Gemini's expected format, by reference when it was uploaded
+        if file_id:
+            file_part = {"file_id": file_id, "format": "audio/wav"}
+        else:
+            audio_base64 = self.encode_audio_to_base64(audio_bytes)
+            file_part = {"file_data": f"data:audio/wav;base64,{audio_base64}"}
+        
+        user_message = {
             "role": "user",
             "content": [
                 {
@@ -183,14 +292,12 @@ Start your output by repeating the context lines exactly, then add new transcrip
                 },
                 {
                     "type": "file",
-                    "file": {
-                        "file_data": f"data:audio/wav;base64,{audio_base64}"
-                    }
+                    "file": file_part
                 }
             ]
-        })
+        }
         
-        return messages
+        return [self._get_system_message(meeting_context), user_message]
     
     def _convert_context_to_relative(self, context: str, chunk_start_seconds: float) -> str:
         """Convert absolute timestamps in context to relative timestamps for current chunk.
@@ -202,29 +309,46 @@ Start your output by repeating the context lines exactly, then add new transcrip
         Returns:
             Context string with relative timestamps
         """
+        # Stay in int arithmetic; rounding the start up truncates the relative time like before
+        chunk_start = math.ceil(chunk_start_seconds)
+        
         def convert_timestamp(match):
-            timestamp_str = match.group(1)  # HH:MM:SS
-            try:
-                time_parts = timestamp_str.split(':')
-                absolute_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
-                
-                # Convert to relative seconds
-                relative_seconds = absolute_seconds - chunk_start_seconds
-                
-                # Ensure non-negative (context should be from end of previous chunk)
-                if relative_seconds < 0:
-                    relative_seconds = 0
-                
-                # Convert back to MM:SS format for LLM
-                minutes = int(relative_seconds // 60)
-                seconds = int(relative_seconds % 60)
-                return f"[{minutes:02d}:{seconds:02d}]"
-            except (ValueError, IndexError):
-                # Return original if parsing fails
-                return match.group(0)
+            # The pattern guarantees digits, so no parse error handling is needed
+            absolute_seconds = int(match[1]) * 3600 + int(match[2]) * 60 + int(match[3])
+            
+            # Convert to relative seconds, non-negative since context should be from end of previous chunk
+            relative_seconds = max(absolute_seconds - chunk_start, 0)
+            
+            # Convert back to MM:SS format for LLM
+            return "[%02d:%02d]" % divmod(relative_seconds, 60)
         
         # Replace all timestamps [HH:MM:SS] with relative versions
-        return re.sub(r'\[(\d{2}:\d{2}:\d{2})\]', convert_timestamp, context)
+        return _ABSOLUTE_TIMESTAMP_RE.sub(convert_timestamp, context)
+    
+    def _handle_llm_response(self, response) -> str:
+        """Record usage for an LLM response and extract its text.
+        
+        Args:
+            response: Completion response from LiteLLM
+            
+        Returns:
+            Response text from LLM
+            
+        Raises:
+            ValueError: If the response is empty (retried by the callers)
+        """
+        # Track cost and request count even for invalid responses
+        cost = completion_cost(completion_response=response)
+        with self._stats_lock:
+            self.total_cost += cost
+            self.request_count += 1
+        
+        # Check for empty response
+        response_text = response.choices[0].message.content
+        if not response_text or not response_text.strip():
+            raise ValueError("Empty response from LLM")
+        
+        return response_text
     
     def _make_llm_call_with_retry(self, messages: List[dict], **kwargs) -> str:
         """Make LLM API call with retry logic.
@@ -246,18 +370,7 @@ Start your output by repeating the context lines exactly, then add new transcrip
                 messages=messages,
                 **kwargs
             )
-
-            # Track cost and request count even for invalid responses
-            cost = completion_cost(completion_response=response)
-            self.total_cost += cost
-            self.request_count += 1
-
-            # Check for empty response
-            response_text = response.choices[0].message.content
-            if not response_text or not response_text.strip():
-                raise ValueError("Empty response from LLM")
-            
-            return response_text
+            return self._handle_llm_response(response)
         
         try:
             return _call_llm()
@@ -265,32 +378,37 @@ Start your output by repeating the context lines exactly, then add new transcrip
             logger.error(f"LLM call failed after retries: {e}")
             raise
     
-    def _convert_relative_to_absolute_seconds(self, relative_timestamp: str, chunk_start_seconds: float) -> float:
-        """Convert relative timestamp to absolute seconds.
+    async def _amake_llm_call_with_retry(self, messages: List[dict], **kwargs) -> str:
+        """Make an async LLM API call with retry logic.
         
         Args:
-            relative_timestamp: Timestamp in format [MM:SS] or [M:SS] relative to chunk start
-            chunk_start_seconds: Start time of chunk in seconds
+            messages: List of message dictionaries
+            **kwargs: Additional arguments for acompletion()
             
         Returns:
-            Absolute timestamp in seconds
+            Response text from LLM
+            
+        Raises:
+            Exception: If all retries fail or non-retryable error occurs
         """
+        @stamina.retry(on=self.retryable_exceptions + (ValueError,), attempts=3, wait_initial=1.0, wait_max=10.0)
+        async def _call_llm():
+            # Every attempt, including retries, counts against the request budget
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            
+            response = await acompletion(
+                model=self.model,
+                messages=messages,
+                **kwargs
+            )
+            return self._handle_llm_response(response)
+        
         try:
-            # Parse relative timestamp
-            timestamp_str = relative_timestamp.strip('[]')
-            time_parts = timestamp_str.split(':')
-            # Handle MM:SS format
-            if len(time_parts) == 2:
-                relative_seconds = int(time_parts[0]) * 60 + int(time_parts[1])
-            else:
-                # Fallback for HH:MM:SS format (backwards compatibility)
-                relative_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
-            
-            # Convert to absolute seconds
-            return relative_seconds + chunk_start_seconds
-        except (ValueError, IndexError):
-            # Return 0 if parsing fails
-            return chunk_start_seconds
+            return await _call_llm()
+        except Exception as e:
+            logger.error(f"LLM call failed after retries: {e}")
+            raise
     
     def _log_llm_messages(self, messages: List[dict]) -> None:
         """Log LLM messages in verbose mode, excluding audio data.
@@ -298,6 +416,10 @@ Start your output by repeating the context lines exactly, then add new transcrip
         Args:
             messages: List of message dictionaries to log
         """
+        # Walking and formatting every message part is wasted work unless verbose
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
         logger.debug("LLM Messages:")
         for i, message in enumerate(messages):
             role = message.get("role", "unknown")
@@ -318,7 +440,9 @@ Start your output by repeating the context lines exactly, then add new transcrip
                         # Don't log file data, just metadata
                         file_info = item.get("file", {})
                         file_data = file_info.get("file_data", "")
-                        if file_data.startswith("data:audio/"):
+                        if file_info.get("file_id"):
+                            logger.debug(f"    File part {j+1}: {file_info.get('format', 'unknown')}, file: {file_info['file_id']}")
+                        elif file_data.startswith("data:audio/"):
                             # Extract just the metadata, not the data
                             parts = file_data.split(",", 1)
                             mime_type = parts[0] if len(parts) > 0 else "unknown"
@@ -334,6 +458,9 @@ Start your output by repeating the context lines exactly, then add new transcrip
     def parse_transcription_response(self, response_text: str, chunk_start_seconds: float) -> List[TranscriptionLine]:
         """Parse LLM response into TranscriptionLine objects.
         
+        Well-formed lines are extracted in a single multi-line regex scan; any
+        text between matches goes through the lenient fallback parser.
+        
         Args:
             response_text: Raw response from LLM with relative timestamps
             chunk_start_seconds: Start time of chunk to convert relative to absolute timestamps
@@ -342,80 +469,97 @@ Start your output by repeating the context lines exactly, then add new transcrip
             List of TranscriptionLine objects with absolute timestamps
         """
         lines = []
+        position = 0
         
-        # Split response into lines
-        raw_lines = response_text.strip().split('\n')
+        # Expected format: [MM:SS] or [M:SS] Speaker: text
+        for match in _LINE_RE.finditer(response_text):
+            # Text between two well-formed lines didn't match the expected format
+            if match.start() > position:
+                lines.extend(self._parse_unmatched_lines(response_text[position:match.start()], chunk_start_seconds))
+            
+            minutes, seconds, speaker, text = match.groups()
+            
+            # Convert relative MM:SS straight from the captured digits to absolute seconds.
+            # The text group already starts and ends on non-whitespace, so only the
+            # speaker (which may carry spaces before the colon) needs stripping.
+            # The few distinct speaker names repeat on every line, so they are interned
+            # to share one string per speaker across the whole job.
+            # TranscriptionLine is a plain dataclass, so no pydantic validation runs for
+            # lines the regex has already checked.
+            lines.append(TranscriptionLine(
+                timestamp=int(minutes) * 60 + int(seconds) + chunk_start_seconds,
+                speaker=sys.intern(speaker.strip()),
+                text=text
+            ))
+            position = match.end()
+        
+        if position < len(response_text):
+            lines.extend(self._parse_unmatched_lines(response_text[position:], chunk_start_seconds))
+        
+        return lines
+    
+    def _parse_unmatched_lines(self, text: str, chunk_start_seconds: float) -> List[TranscriptionLine]:
+        """Salvage what we can from response lines that didn't match the expected format.
         
-        for line in raw_lines:
+        Args:
+            text: Raw response text that fell between well-formed lines
+            chunk_start_seconds: Start time of chunk to convert relative to absolute timestamps
+            
+        Returns:
+            List of TranscriptionLine objects for lines that at least contain a timestamp
+        """
+        lines = []
+        
+        for line in text.split('\n'):
             line = line.strip()
             if not line:
                 continue
             
-            # Try to parse timestamp and speaker
-            # Expected format: [MM:SS] or [M:SS] Speaker: text
-            match = re.match(r'\[(\d{1,2}:\d{2})\]\s*([^:]+):\s*(.+)', line)
+            # If parsing fails, log warning and try to extract what we can
+            logger.warning(f"Could not parse line: {line}")
             
-            if match:
-                relative_timestamp = f"[{match.group(1)}]"
-                speaker = match.group(2).strip()
-                text = match.group(3).strip()
-                
+            # Try to find at least a timestamp
+            timestamp_match = _RELATIVE_TIMESTAMP_RE.search(line)
+            if timestamp_match:
                 # Convert relative timestamp to absolute seconds
-                absolute_seconds = self._convert_relative_to_absolute_seconds(relative_timestamp, chunk_start_seconds)
+                absolute_seconds = int(timestamp_match[1]) * 60 + int(timestamp_match[2]) + chunk_start_seconds
+                
+                # Use the rest as speaker + text
+                remaining = f"{line[:timestamp_match.start()]}{line[timestamp_match.end():]}".strip()
+                if ':' in remaining:
+                    speaker, text_part = remaining.split(':', 1)
+                    speaker = sys.intern(speaker.strip())
+                    text_part = text_part.strip()
+                else:
+                    speaker = "Unknown"
+                    text_part = remaining
                 
                 lines.append(TranscriptionLine(
                     timestamp=absolute_seconds,
                     speaker=speaker,
-                    text=text
+                    text=text_part
                 ))
-            else:
-                # If parsing fails, log warning and try to extract what we can
-                logger.warning(f"Could not parse line: {line}")
-                
-                # Try to find at least a timestamp
-                timestamp_match = re.search(r'\[(\d{1,2}:\d{2})\]', line)
-                if timestamp_match:
-                    relative_timestamp = f"[{timestamp_match.group(1)}]"
-                    # Convert relative timestamp to absolute seconds
-                    absolute_seconds = self._convert_relative_to_absolute_seconds(relative_timestamp, chunk_start_seconds)
-                    
-                    # Use the rest as speaker + text
-                    remaining = line.replace(timestamp_match.group(0), '').strip()
-                    if ':' in remaining:
-                        parts = remaining.split(':', 1)
-                        speaker = parts[0].strip()
-                        text = parts[1].strip()
-                    else:
-                        speaker = "Unknown"
-                        text = remaining
-                    
-                    lines.append(TranscriptionLine(
-                        timestamp=absolute_seconds,
-                        speaker=speaker,
-                        text=text
-                    ))
         
         return lines
     
-    def transcribe_chunk(self, chunk: ChunkData, audio_bytes: bytes, context: Optional[str] = None, meeting_context: Optional[str] = None) -> TranscriptionResult:
-        """Transcribe a single audio chunk.
+    def _prepare_chunk_messages(self, chunk: ChunkData, audio_bytes: bytes, context: Optional[str], meeting_context: Optional[str], file_id: Optional[str], speaker_context: Optional[str] = None) -> List[dict]:
+        """Create and log the messages for transcribing a chunk.
         
         Args:
             chunk: ChunkData object
             audio_bytes: Audio data as bytes
             context: Optional context from previous chunk
             meeting_context: Optional context about the meeting for better transcription
+            file_id: Optional URI of already uploaded chunk audio
+            speaker_context: Optional sample lines of speakers from earlier chunks
             
         Returns:
-            TranscriptionResult object
+            List of message dictionaries
         """
-        start_time = time.time()
+        messages = self.create_messages(audio_bytes, chunk.start_time_seconds, context, meeting_context, file_id, speaker_context)
         
-        try:
-            # Create messages
-            messages = self.create_messages(audio_bytes, chunk.start_time_seconds, context, meeting_context)
-            
-            logger.info(f"Transcribing chunk {chunk.chunk_index} with model {self.model}")
+        logger.info(f"Transcribing chunk {chunk.chunk_index} with model {self.model}")
+        if logger.isEnabledFor(logging.DEBUG):
             if context:
                 logger.debug(f"Using context: {context[:100]}...")
             if meeting_context:
@@ -423,48 +567,122 @@ Start your output by repeating the context lines exactly, then add new transcrip
             
             # Log message structure without the actual audio data
             logger.debug(f"Sending {len(messages)} messages, audio size: {len(audio_bytes)} bytes")
+        
+        # Log messages in verbose mode (excluding audio data)
+        self._log_llm_messages(messages)
+        
+        return messages
+    
+    def _create_chunk_result(self, chunk: ChunkData, response_text: str, start_time: float) -> TranscriptionResult:
+        """Parse an LLM response into the chunk's TranscriptionResult.
+        
+        Args:
+            chunk: ChunkData object
+            response_text: Raw response from LLM
+            start_time: time.time() when transcription of the chunk started
             
-            # Log messages in verbose mode (excluding audio data)
-            self._log_llm_messages(messages)
+        Returns:
+            TranscriptionResult object
+        """
+        # Log LLM response in verbose mode
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"LLM Response:\n{response_text}")
+        
+        # Parse transcription lines (convert relative timestamps to absolute)
+        lines = self.parse_transcription_response(response_text, chunk.start_time_seconds)
+        
+        processing_time = time.time() - start_time
+        
+        logger.info(f"Transcribed chunk {chunk.chunk_index}: {len(lines)} lines in {processing_time:.2f}s")
+        
+        # Pydantic takes the parsed line instances as they are, without revalidating each one
+        return TranscriptionResult(
+            chunk_index=chunk.chunk_index,
+            lines=lines,
+            raw_response=response_text,
+            model_used=self.model,
+            processing_time_seconds=processing_time
+        )
+    
+    def _create_error_result(self, chunk: ChunkData, error: Exception, start_time: float) -> TranscriptionResult:
+        """Create an empty TranscriptionResult recording why a chunk failed.
+        
+        Args:
+            chunk: ChunkData object
+            error: Exception raised while transcribing
+            start_time: time.time() when transcription of the chunk started
+            
+        Returns:
+            TranscriptionResult object without lines
+        """
+        processing_time = time.time() - start_time
+        logger.error(f"Error transcribing chunk {chunk.chunk_index}: {error}")
+        
+        # Return empty result with error info
+        return TranscriptionResult(
+            chunk_index=chunk.chunk_index,
+            lines=[],
+            raw_response=f"Error: {str(error)}",
+            model_used=self.model,
+            processing_time_seconds=processing_time
+        )
+    
+    def transcribe_chunk(self, chunk: ChunkData, audio_bytes: bytes, context: Optional[str] = None, meeting_context: Optional[str] = None, speaker_context: Optional[str] = None) -> TranscriptionResult:
+        """Transcribe a single audio chunk.
+        
+        Args:
+            chunk: ChunkData object
+            audio_bytes: Audio data as bytes
+            context: Optional context from previous chunk
+            meeting_context: Optional context about the meeting for better transcription
+            speaker_context: Optional sample lines of speakers from earlier chunks
+            
+        Returns:
+            TranscriptionResult object
+        """
+        start_time = time.time()
+        
+        try:
+            # Create messages, referencing uploaded audio when enabled
+            file_id = self._get_chunk_file_id(chunk, audio_bytes)
+            messages = self._prepare_chunk_messages(chunk, audio_bytes, context, meeting_context, file_id, speaker_context)
             
             # Make API call with retry logic
-            response_text = self._make_llm_call_with_retry(
-                messages,
-                max_tokens=16000,  # Generous limit for transcription
-                temperature=0.1,  # Low temperature for consistent transcription
-                reasoning_effort="low",
-            )
+            response_text = self._make_llm_call_with_retry(messages, **_TRANSCRIPTION_PARAMS)
             
-            # Log LLM response in verbose mode
-            logger.debug(f"LLM Response:\n{response_text}")
+            return self._create_chunk_result(chunk, response_text, start_time)
             
-            # Parse transcription lines (convert relative timestamps to absolute)
-            lines = self.parse_transcription_response(response_text, chunk.start_time_seconds)
+        except Exception as e:
+            return self._create_error_result(chunk, e, start_time)
+    
+    async def atranscribe_chunk(self, chunk: ChunkData, audio_bytes: bytes, context: Optional[str] = None, meeting_context: Optional[str] = None) -> TranscriptionResult:
+        """Transcribe a single audio chunk without blocking the event loop.
+        
+        Args:
+            chunk: ChunkData object
+            audio_bytes: Audio data as bytes
+            context: Optional context from previous chunk
+            meeting_context: Optional context about the meeting for better transcription
             
-            processing_time = time.time() - start_time
+        Returns:
+            TranscriptionResult object
+        """
+        start_time = time.time()
+        
+        try:
+            # Uploads are a one-off blocking call per chunk, keep them off the event loop
+            file_id = None
+            if self.upload_audio:
+                file_id = await asyncio.to_thread(self._get_chunk_file_id, chunk, audio_bytes)
+            messages = self._prepare_chunk_messages(chunk, audio_bytes, context, meeting_context, file_id)
             
-            logger.info(f"Transcribed chunk {chunk.chunk_index}: {len(lines)} lines in {processing_time:.2f}s")
+            # Make API call with retry logic
+            response_text = await self._amake_llm_call_with_retry(messages, **_TRANSCRIPTION_PARAMS)
             
-            return TranscriptionResult(
-                chunk_index=chunk.chunk_index,
-                lines=lines,
-                raw_response=response_text,
-                model_used=self.model,
-                processing_time_seconds=processing_time
-            )
+            return self._create_chunk_result(chunk, response_text, start_time)
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Error transcribing chunk {chunk.chunk_index}: {e}")
-            
-            # Return empty result with error info
-            return TranscriptionResult(
-                chunk_index=chunk.chunk_index,
-                lines=[],
-                raw_response=f"Error: {str(e)}",
-                model_used=self.model,
-                processing_time_seconds=processing_time
-            )
+            return self._create_error_result(chunk, e, start_time)
     
     def test_connection(self) -> bool:
         """Test if the LLM client can connect and make a simple request.
@@ -1,11 +1,13 @@
 """Pydantic models for transcriber."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
-from .timestamp_utils import format_timestamp, parse_timestamp
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from .timestamp_utils import format_timestamp
 from pydub import AudioSegment
 
 
@@ -19,18 +21,100 @@ class Config(BaseModel):
         default=["wav", "mp3", "m4a", "flac", "ogg", "aac"],
         description="Supported audio formats"
     )
+    audio_sample_rate: Optional[int] = Field(
+        default=16000,
+        description="Sample rate audio is resampled to when loaded (None keeps the source rate)"
+    )
+    audio_channels: Optional[int] = Field(
+        default=1,
+        description="Number of channels audio is mixed down to when loaded (None keeps the source layout)"
+    )
+    max_concurrent_chunks: int = Field(
+        default=1,
+        description="Maximum number of chunks to transcribe concurrently (1 keeps previous-chunk context)"
+    )
+    requests_per_minute: Optional[float] = Field(
+        default=None,
+        description="Client-side limit on LLM requests per minute for concurrent transcription (None for no limit)"
+    )
+    upload_audio: bool = Field(
+        default=False,
+        description="Upload chunk audio once via the Gemini Files API instead of inlining base64 in every request"
+    )
+    speaker_samples: int = Field(
+        default=0,
+        description="Earlier lines per speaker sent with each chunk to keep speaker labels consistent (0 disables)"
+    )
+    result_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached chunk transcriptions, reused when the same request is made again (None disables)"
+    )
     
-    @validator('chunk_duration_minutes')
+    @field_validator('chunk_duration_minutes')
+    @classmethod
     def validate_chunk_duration(cls, v):
         if v <= 0:
             raise ValueError("Chunk duration must be positive")
         return v
     
-    @validator('overlap_duration_minutes')
+    @field_validator('overlap_duration_minutes')
+    @classmethod
     def validate_overlap_duration(cls, v):
         if v < 0:
             raise ValueError("Overlap duration must be non-negative")
         return v
+    
+    @field_validator('audio_sample_rate', 'audio_channels')
+    @classmethod
+    def validate_audio_format(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("Audio sample rate and channels must be positive")
+        return v
+    
+    @field_validator('requests_per_minute')
+    @classmethod
+    def validate_requests_per_minute(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("Requests per minute must be positive")
+        return v
+    
+    @field_validator('speaker_samples')
+    @classmethod
+    def validate_speaker_samples(cls, v):
+        if v < 0:
+            raise ValueError("Speaker samples must be non-negative")
+        return v
+    
+    @field_validator('max_concurrent_chunks')
+    @classmethod
+    def validate_max_concurrent_chunks(cls, v):
+        if v < 1:
+            raise ValueError("Max concurrent chunks must be at least 1")
+        return v
+
+
+class PCMAudio(BaseModel):
+    """Decoded audio kept in memory as raw interleaved PCM."""
+    
+    data: bytes = Field(repr=False, description="Raw little-endian PCM samples")
+    sample_rate: int = Field(description="Sample rate in Hz")
+    channels: int = Field(description="Number of interleaved channels")
+    sample_width: int = Field(description="Bytes per sample")
+    
+    @property
+    def frame_width(self) -> int:
+        """Get the number of bytes per frame (one sample for every channel)."""
+        return self.channels * self.sample_width
+    
+    @property
+    def frame_count(self) -> int:
+        """Get the number of frames in the audio."""
+        return len(self.data) // self.frame_width
+    
+    @property
+    def duration_seconds(self) -> float:
+        """Get the audio duration in seconds."""
+        return self.frame_count / self.sample_rate
 
 
 class ChunkData(BaseModel):
@@ -40,37 +124,52 @@ class ChunkData(BaseModel):
     end_time_seconds: float = Field(description="End time of chunk in seconds")
     chunk_index: int = Field(description="Index of this chunk (0-based)")
     audio_segment: Optional[AudioSegment] = Field(default=None, description="Audio segment data")
+    audio: Optional[PCMAudio] = Field(default=None, description="Decoded audio of the whole file, shared by all chunks")
+    start_byte: int = Field(default=0, description="Offset of the chunk's first PCM byte in audio.data")
+    end_byte: int = Field(default=0, description="Offset just past the chunk's last PCM byte in audio.data")
+    uploaded_file_id: Optional[str] = Field(default=None, description="Files API URI of the uploaded chunk audio, reused across requests")
     
-    class Config:
-        arbitrary_types_allowed = True  # Allow AudioSegment
+    model_config = ConfigDict(arbitrary_types_allowed=True)  # Allow AudioSegment
     
-    @validator('start_time_seconds')
+    @field_validator('start_time_seconds')
+    @classmethod
     def validate_start_time(cls, v):
         if v < 0:
             raise ValueError("Start time must be non-negative")
         return v
     
-    @validator('end_time_seconds')
-    def validate_end_time(cls, v, values):
+    @field_validator('end_time_seconds')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
         if v < 0:
             raise ValueError("End time must be non-negative")
-        if 'start_time_seconds' in values and v <= values['start_time_seconds']:
+        if 'start_time_seconds' in info.data and v <= info.data['start_time_seconds']:
             raise ValueError("End time must be greater than start time")
         return v
 
 
-class TranscriptionLine(BaseModel):
-    """A single line of transcription."""
+@dataclass(frozen=True, slots=True)
+class TranscriptionLine:
+    """A single line of transcription.
     
-    timestamp: float = Field(description="Timestamp in seconds from start of audio")
-    speaker: str = Field(description="Speaker name or identifier")
-    text: str = Field(description="Transcribed text")
+    A slotted dataclass rather than a pydantic model: a long recording produces
+    thousands of lines, and this keeps each one small and cheap to create.
+    Pydantic still validates the fields whenever lines are loaded as part of a
+    model, e.g. a TranscriptionResult read back from JSON.
+    """
     
-    @validator('timestamp')
-    def validate_timestamp(cls, v):
-        if v < 0:
+    timestamp: float  # Timestamp in seconds from start of audio
+    speaker: str  # Speaker name or identifier
+    text: str  # Transcribed text
+    
+    # "[HH:MM:SS] Speaker: text", built once at construction; every output path reuses it
+    formatted: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.timestamp < 0:
             raise ValueError("Timestamp must be non-negative")
-        return v
+        # Frozen dataclasses only allow setting derived fields through object.__setattr__
+        object.__setattr__(self, 'formatted', f"{self.formatted_timestamp} {self.speaker}: {self.text}")
     
     @property
     def formatted_timestamp(self) -> str:
@@ -78,7 +177,7 @@ class TranscriptionLine(BaseModel):
         return format_timestamp(self.timestamp)
     
     def __str__(self) -> str:
-        return f"{self.formatted_timestamp} {self.speaker}: {self.text}"
+        return self.formatted
 
 
 class TranscriptionResult(BaseModel):
@@ -90,7 +189,8 @@ class TranscriptionResult(BaseModel):
     model_used: str = Field(description="LLM model that was used")
     processing_time_seconds: float = Field(description="Time taken to process this chunk")
     
-    @validator('processing_time_seconds')
+    @field_validator('processing_time_seconds')
+    @classmethod
     def validate_processing_time(cls, v):
         if v < 0:
             raise ValueError("Processing time must be non-negative")
@@ -98,25 +198,36 @@ class TranscriptionResult(BaseModel):
     
     @property
     def text(self) -> str:
-        """Get the full transcription text."""
-        return "\n".join(str(line) for line in self.lines)
+        """Get the full transcription text.
+        
+        Joined on access so it always matches the current lines; each line's
+        formatted string is built once when the line is created.
+        """
+        return "\n".join(line.formatted for line in self.lines)
     
-    def get_last_minute_context(self, chunk_duration_minutes: int = 10) -> str:
-        """Extract the last minute of transcription for context."""
+    def get_last_minute_context(self, chunk_duration_minutes: int = 10, overlap_duration_minutes: int = 1) -> str:
+        """Extract the last minute of transcription for context.
+        
+        Args:
+            chunk_duration_minutes: Duration of each chunk in minutes
+            overlap_duration_minutes: Overlap between consecutive chunks in minutes
+            
+        Returns:
+            Lines from the last minute of this chunk's window, one per line
+        """
         if not self.lines:
             return ""
         
-        # Calculate the last minute timestamp
-        chunk_start_minutes = self.chunk_index * (chunk_duration_minutes - 1)  # Account for overlap
+        # Chunks start every (duration - overlap) minutes
+        chunk_start_minutes = self.chunk_index * (chunk_duration_minutes - overlap_duration_minutes)
         last_minute_start_seconds = (chunk_start_minutes + chunk_duration_minutes - 1) * 60
         
-        # Find lines from the last minute (timestamps are already in seconds)
-        context_lines = []
-        for line in self.lines:
-            if line.timestamp >= last_minute_start_seconds:
-                context_lines.append(line)
-        
-        return "\n".join(str(line) for line in context_lines)
+        # Timestamps are already in seconds, so one pass filters and formats
+        return "\n".join(str(line) for line in self.lines if line.timestamp >= last_minute_start_seconds)
+
+
+# Sort key for results, a C-level attribute lookup instead of a lambda
+_CHUNK_INDEX = attrgetter('chunk_index')
 
 
 class TranscriptionJob(BaseModel):
@@ -132,7 +243,8 @@ class TranscriptionJob(BaseModel):
     started_at: Optional[datetime] = Field(default=None, description="When the job started")
     completed_at: Optional[datetime] = Field(default=None, description="When the job completed")
     
-    @validator('input_file')
+    @field_validator('input_file')
+    @classmethod
     def validate_input_file(cls, v):
         if not v.exists():
             raise ValueError(f"Input file does not exist: {v}")
@@ -150,18 +262,29 @@ class TranscriptionJob(BaseModel):
             return 0.0
         return (self.completed_at - self.started_at).total_seconds()
     
+    @property
+    def report_file(self) -> Path:
+        """Get the path of the summary report written next to the output file."""
+        return self.output_file.with_suffix('.report.txt')
+    
+    @property
+    def json_file(self) -> Path:
+        """Get the path of the JSON export written next to the output file."""
+        return self.output_file.with_suffix('.json')
+    
+    @property
+    def sorted_results(self) -> List[TranscriptionResult]:
+        """Get results ordered by chunk index.
+        
+        Results are usually appended in order already, which timsort handles in one pass.
+        """
+        return sorted(self.results, key=_CHUNK_INDEX)
+    
     @property
     def final_transcription(self) -> str:
         """Get the final merged transcription."""
         if not self.results:
             return ""
         
-        # Sort results by chunk index
-        sorted_results = sorted(self.results, key=lambda r: r.chunk_index)
-        
-        # Combine all transcriptions
-        all_lines = []
-        for result in sorted_results:
-            all_lines.extend(result.lines)
-        
-        return "\n".join(str(line) for line in all_lines)
\ No newline at end of file
+        # Combine the already formatted chunk texts, skipping chunks without lines
+        return "\n".join(result.text for result in self.sorted_results if result.lines)
\ No newline at end of file
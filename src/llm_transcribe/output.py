@@ -1,13 +1,25 @@
 """Output handling and formatting."""
 
+import json
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from .models import TranscriptionJob, TranscriptionResult
+from .models import TranscriptionJob, TranscriptionLine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Punctuation the LLM tends to vary between two transcriptions of the same utterance
+_TRAILING_PUNCTUATION = ".,!?;:…"
+
+# How far apart two chunks may place the same utterance; repeats further apart are kept
+_DUPLICATE_TOLERANCE_SECONDS = 5.0
+
+
+def _line_fingerprint(line: TranscriptionLine) -> Tuple[str, str]:
+    """Get a key for a line's speaker and wording, ignoring whitespace, case and trailing punctuation."""
+    return line.speaker, " ".join(line.text.split()).rstrip(_TRAILING_PUNCTUATION).casefold()
+
 
 class OutputHandler:
     """Handles formatting and writing transcription outputs."""
@@ -24,23 +36,8 @@ class OutputHandler:
         Returns:
             Formatted transcription text
         """
-        if not job.results:
-            return ""
-        
-        # Sort results by chunk index to ensure proper order
-        sorted_results = sorted(job.results, key=lambda r: r.chunk_index)
-        
-        # Collect all lines from all chunks
-        all_lines = []
-        for result in sorted_results:
-            all_lines.extend(result.lines)
-        
-        # Format each line
-        formatted_lines = []
-        for line in all_lines:
-            formatted_lines.append(str(line))
-        
-        return "\n".join(formatted_lines)
+        # Joins each chunk's text in chunk order, with no intermediate line lists
+        return job.final_transcription
     
     def deduplicate_overlapping_content(self, job: TranscriptionJob) -> List[str]:
         """Remove duplicate content from overlapping chunks.
@@ -51,27 +48,66 @@ class OutputHandler:
         Returns:
             List of formatted lines with duplicates removed
         """
-        if not job.results:
-            return []
+        return list(self.iter_deduplicated_lines(job))
+    
+    def iter_deduplicated_lines(self, job: TranscriptionJob) -> Iterator[str]:
+        """Yield formatted lines in chunk order, skipping duplicates from overlapping chunks.
         
-        # Sort results by chunk index
-        sorted_results = sorted(job.results, key=lambda r: r.chunk_index)
+        A line is kept only if it is later than every line kept before it. Within
+        a chunk's leading overlap window, a line is also skipped if the previous
+        chunk emitted the same speaker and wording within a few seconds of it,
+        which catches repeats the LLM placed slightly later the second time.
+        Genuine repeats further apart (e.g. two separate "Okay."s) are kept.
+        
+        Args:
+            job: TranscriptionJob with results
+            
+        Yields:
+            Formatted transcription lines
+        """
+        config = job.config
+        chunk_step_seconds = (config.chunk_duration_minutes - config.overlap_duration_minutes) * 60
+        overlap_seconds = config.overlap_duration_minutes * 60
         
-        all_lines = []
         last_timestamp_seconds = -1
+        # (timestamp, fingerprint) of lines kept from the end of the previous chunk
+        previous_tail: List[Tuple[float, Tuple[str, str]]] = []
         
-        for result in sorted_results:
+        for result in job.sorted_results:
+            chunk_start_seconds = result.chunk_index * chunk_step_seconds
+            overlap_end_seconds = chunk_start_seconds + overlap_seconds
+            next_chunk_start_seconds = chunk_start_seconds + chunk_step_seconds
+            
+            # Only lines inside this chunk's overlap window can reappear here
+            # (a gap left by a failed chunk leaves this empty)
+            overlap_timestamps: Dict[Tuple[str, str], List[float]] = {}
+            for timestamp, fingerprint in previous_tail:
+                if timestamp >= chunk_start_seconds:
+                    overlap_timestamps.setdefault(fingerprint, []).append(timestamp)
+            previous_tail = []
+            
             for line in result.lines:
                 # Timestamps are already in seconds as float
-                if line.timestamp > last_timestamp_seconds:
-                    all_lines.append(str(line))
-                    last_timestamp_seconds = line.timestamp
-        
-        return all_lines
+                if line.timestamp <= last_timestamp_seconds:
+                    continue
+                
+                # Fingerprints are only needed near the chunk edges, so most lines skip the hashing
+                if overlap_timestamps and line.timestamp < overlap_end_seconds:
+                    matches = overlap_timestamps.get(_line_fingerprint(line), ())
+                    if any(abs(line.timestamp - timestamp) <= _DUPLICATE_TOLERANCE_SECONDS for timestamp in matches):
+                        continue
+                if line.timestamp >= next_chunk_start_seconds:
+                    previous_tail.append((line.timestamp, _line_fingerprint(line)))
+                
+                yield str(line)
+                last_timestamp_seconds = line.timestamp
     
     def write_transcription_file(self, job: TranscriptionJob, deduplicate: bool = True) -> None:
         """Write transcription to output file.
         
+        Lines are written as they are produced instead of being joined into
+        one string first, so long transcriptions aren't held in memory twice.
+        
         Args:
             job: Completed TranscriptionJob
             deduplicate: Whether to remove duplicate content from overlaps
@@ -82,21 +118,24 @@ class OutputHandler:
         
         logger.info(f"Writing transcription to {job.output_file}")
         
-        # Format content
+        # Format content lazily; without deduplication each chunk's text is one block
         if deduplicate:
-            lines = self.deduplicate_overlapping_content(job)
-            content = "\n".join(lines)
+            blocks = self.iter_deduplicated_lines(job)
         else:
-            content = self.format_transcription(job)
+            blocks = (result.text for result in job.sorted_results if result.lines)
         
         # Ensure output directory exists
         job.output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file
+        # Write file, separating blocks with newlines but without a trailing one
+        characters = 0
+        separator = ""
         with open(job.output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+            for block in blocks:
+                characters += f.write(separator) + f.write(block)
+                separator = "\n"
         
-        logger.info(f"Transcription written: {len(content)} characters")
+        logger.info(f"Transcription written: {characters} characters")
     
     def create_summary_report(self, job: TranscriptionJob) -> str:
         """Create a summary report of the transcription job.
@@ -110,13 +149,18 @@ class OutputHandler:
         if not job.is_completed:
             return "Job not completed"
         
-        # Calculate statistics
-        total_lines = sum(len(result.lines) for result in job.results)
-        total_processing_time = sum(result.processing_time_seconds for result in job.results)
-        avg_processing_time = total_processing_time / len(job.results) if job.results else 0
+        # Calculate statistics in a single pass over the results
+        total_lines = 0
+        total_processing_time = 0.0
+        successful_chunks = 0
+        for result in job.results:
+            line_count = len(result.lines)
+            total_lines += line_count
+            total_processing_time += result.processing_time_seconds
+            if line_count:
+                successful_chunks += 1
         
-        # Count successful chunks
-        successful_chunks = sum(1 for result in job.results if result.lines)
+        avg_processing_time = total_processing_time / len(job.results) if job.results else 0
         failed_chunks = len(job.results) - successful_chunks
         
         # Get audio duration if available
@@ -124,6 +168,11 @@ class OutputHandler:
         if job.chunks:
             audio_duration = job.chunks[-1].end_time_seconds
         
+        # Derived figures, guarded against jobs with no audio or no processing time
+        audio_minutes = audio_duration / 60
+        audio_processing_ratio = audio_duration / total_processing_time if total_processing_time else 0.0
+        real_time_factor = total_processing_time / audio_duration if audio_duration else 0.0
+        
         report = f"""Transcription Summary Report
 {'=' * 50}
 
@@ -132,7 +181,7 @@ Output File: {job.output_file}
 Model Used: {job.model}
 
 Audio Information:
-- Duration: {audio_duration:.2f} seconds ({audio_duration/60:.2f} minutes)
+- Duration: {audio_duration:.2f} seconds ({audio_minutes:.2f} minutes)
 - Total Chunks: {len(job.chunks)}
 - Chunk Duration: {job.config.chunk_duration_minutes} minutes
 - Overlap Duration: {job.config.overlap_duration_minutes} minutes
@@ -146,8 +195,8 @@ Processing Results:
 - Job Duration: {job.total_duration_seconds:.2f} seconds
 
 Performance:
-- Audio/Processing Ratio: {audio_duration/total_processing_time:.2f}x
-- Real-time Factor: {total_processing_time/audio_duration:.2f}
+- Audio/Processing Ratio: {audio_processing_ratio:.2f}x
+- Real-time Factor: {real_time_factor:.2f}
 """
         
         return report
@@ -160,7 +209,7 @@ Performance:
             report_file: Optional path for report file (defaults to output_file.report.txt)
         """
         if report_file is None:
-            report_file = job.output_file.with_suffix('.report.txt')
+            report_file = job.report_file
         
         report = self.create_summary_report(job)
         
@@ -231,11 +280,11 @@ Performance:
             if format_type == 'txt':
                 self.write_transcription_file(job)
             elif format_type == 'json':
-                import json
-                json_file = job.output_file.with_suffix('.json')
+                json_file = job.json_file
                 data = self.format_for_json(job)
+                # json.dump would issue a separate write call for every token
                 with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.write(json.dumps(data, indent=2, ensure_ascii=False))
                 logger.info(f"JSON export written: {json_file}")
             elif format_type == 'report':
                 self.write_summary_report(job)
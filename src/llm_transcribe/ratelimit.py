@@ -0,0 +1,61 @@
+"""Client-side rate limiting for LLM requests."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Token bucket that spaces out requests to stay under a requests-per-minute limit."""
+    
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        """Create a rate limiter.
+        
+        Args:
+            requests_per_minute: Sustained number of requests allowed per minute
+            burst: Number of requests that may start back to back before spacing kicks in
+        
+        Raises:
+            ValueError: If the rate or burst size is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("Requests per minute must be positive")
+        if burst < 1:
+            raise ValueError("Burst size must be at least 1")
+        
+        self.rate = requests_per_minute / 60  # Tokens per second
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        
+        # asyncio locks belong to one event loop, so one is created per loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until the bucket holds enough tokens, then take them.
+        
+        Args:
+            tokens: Number of tokens (requests) to take
+        """
+        # Waiters queue on the lock, so requests are released in arrival order
+        async with self._get_lock():
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
@@ -3,6 +3,12 @@
 import re
 from typing import Optional
 
+# Pattern to match [HH:MM:SS] format, compiled once for repeated lookups
+_TIMESTAMP_RE = re.compile(r'\[(\d{1,2}):(\d{2}):(\d{2})\]')
+
+# Bare H:MM:SS value (brackets already stripped), any number of hour digits
+_CLOCK_RE = re.compile(r'(\d+):(\d{1,2}):(\d{1,2})')
+
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds to [HH:MM:SS] format.
@@ -13,10 +19,10 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string in [HH:MM:SS] format
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
+    # Truncate once, then stay in integer arithmetic; plain // and % avoid
+    # the intermediate tuples divmod returns
+    total = int(seconds)
+    return "[%02d:%02d:%02d]" % (total // 3600, total // 60 % 60, total % 60)
 
 
 def parse_timestamp(timestamp: str) -> float:
@@ -31,26 +37,18 @@ def parse_timestamp(timestamp: str) -> float:
     Raises:
         ValueError: If timestamp format is invalid
     """
-    # Remove brackets and whitespace
-    time_str = timestamp.strip().strip('[]')
-    
-    # Split on colons
-    parts = time_str.split(':')
-    if len(parts) != 3:
+    # Remove brackets and whitespace, then match format and digits in one go
+    match = _CLOCK_RE.fullmatch(timestamp.strip().strip('[]'))
+    if not match:
         raise ValueError(f"Invalid timestamp format: {timestamp}")
     
-    try:
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        seconds = int(parts[2])
-        
-        # Validate ranges
-        if minutes >= 60 or seconds >= 60:
-            raise ValueError(f"Invalid time values in timestamp: {timestamp}")
-        
-        return hours * 3600 + minutes * 60 + seconds
-    except ValueError as e:
-        raise ValueError(f"Invalid timestamp format: {timestamp}") from e
+    hours, minutes, seconds = int(match[1]), int(match[2]), int(match[3])
+    
+    # Validate ranges
+    if minutes >= 60 or seconds >= 60:
+        raise ValueError(f"Invalid time values in timestamp: {timestamp}")
+    
+    return hours * 3600 + minutes * 60 + seconds
 
 
 def parse_timestamp_from_text(text: str) -> Optional[float]:
@@ -62,16 +60,16 @@ def parse_timestamp_from_text(text: str) -> Optional[float]:
     Returns:
         Time in seconds if found, None otherwise
     """
-    # Pattern to match [HH:MM:SS] format
-    pattern = r'\[(\d{1,2}):(\d{2}):(\d{2})\]'
-    match = re.search(pattern, text)
+    match = _TIMESTAMP_RE.search(text)
+    if match is None:
+        return None
     
-    if match:
-        hours, minutes, seconds = map(int, match.groups())
-        if minutes < 60 and seconds < 60:
-            return hours * 3600 + minutes * 60 + seconds
+    # Index the groups directly; the pattern guarantees digits so int() cannot fail
+    minutes, seconds = int(match[2]), int(match[3])
+    if minutes >= 60 or seconds >= 60:
+        return None
     
-    return None
+    return int(match[1]) * 3600 + minutes * 60 + seconds
 
 
 def seconds_to_duration_str(seconds: float) -> str:
@@ -83,9 +81,8 @@ def seconds_to_duration_str(seconds: float) -> str:
     Returns:
         Duration string like "1h 23m 45s" or "23m 45s" or "45s"
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
     
     parts = []
     if hours > 0:
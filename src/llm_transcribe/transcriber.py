@@ -1,16 +1,96 @@
 """Core transcription engine."""
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from .audio import AudioProcessor
+from .cache import ResultCache
 from .llm_client import LLMClient
-from .models import Config, TranscriptionJob, TranscriptionResult
+from .models import ChunkData, Config, TranscriptionJob, TranscriptionLine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long a single line is assumed to last when scoring speaker samples
+_MAX_LINE_DURATION_SECONDS = 30.0
+# Rough speaking rate used when a line has no following line to measure against
+_WORDS_PER_SECOND = 2.5
+
+
+class SpeakerCache:
+    """Representative lines per speaker, used to keep speaker labels consistent across chunks.
+    
+    Lines are scored by duration * (1 + recency_weight * position / total_lines),
+    so long statements are preferred and recent ones break ties. Only the best
+    few lines per speaker are sent, which describes every speaker seen so far in
+    far fewer tokens than earlier transcription text.
+    """
+    
+    def __init__(self, samples_per_speaker: int = 2, recency_weight: float = 0.5):
+        """Create an empty speaker cache.
+        
+        Args:
+            samples_per_speaker: Number of sample lines kept in the context per speaker
+            recency_weight: How strongly later lines are preferred over earlier ones
+        """
+        self.samples_per_speaker = samples_per_speaker
+        self.recency_weight = recency_weight
+        
+        # (position, duration, line) per speaker, in the order lines were added
+        self._lines: Dict[str, List[Tuple[int, float, TranscriptionLine]]] = {}
+        self._total_lines = 0
+        self._last_timestamp = -1.0
+    
+    def add_lines(self, lines: Iterable[TranscriptionLine]) -> None:
+        """Add a chunk's transcription lines to the cache.
+        
+        Lines at or before the latest timestamp already seen, such as the
+        repeated context at the start of a chunk, are skipped.
+        
+        Args:
+            lines: Transcription lines in chronological order
+        """
+        new_lines = [line for line in lines if line.timestamp > self._last_timestamp]
+        if not new_lines:
+            return
+        self._last_timestamp = max(line.timestamp for line in new_lines)
+        
+        for line, next_line in zip(new_lines, new_lines[1:] + [None]):
+            # Time until the next line is the best available duration estimate
+            if next_line is not None and next_line.timestamp > line.timestamp:
+                duration = next_line.timestamp - line.timestamp
+            else:
+                duration = len(line.text.split()) / _WORDS_PER_SECOND
+            duration = min(duration, _MAX_LINE_DURATION_SECONDS)
+            
+            self._lines.setdefault(line.speaker, []).append((self._total_lines, duration, line))
+            self._total_lines += 1
+    
+    def build_context(self) -> str:
+        """Format the highest scoring lines of every speaker.
+        
+        Returns:
+            One "Speaker: text" line per sample, grouped by speaker, or "" if empty
+        """
+        if not self._total_lines or self.samples_per_speaker <= 0:
+            return ""
+        
+        context_lines = []
+        for speaker, entries in self._lines.items():
+            best = sorted(
+                entries,
+                key=lambda entry: entry[1] * (1 + self.recency_weight * (entry[0] + 1) / self._total_lines),
+                reverse=True
+            )[:self.samples_per_speaker]
+            
+            # Keep each speaker's samples in the order they were said
+            for _, _, line in sorted(best, key=lambda entry: entry[0]):
+                context_lines.append(f"{speaker}: {line.text}")
+        
+        return "\n".join(context_lines)
+
 
 class TranscriptionEngine:
     """Core engine for orchestrating transcription process."""
@@ -19,7 +99,12 @@ class TranscriptionEngine:
         self.config = config
         self.model = model
         self.audio_processor = AudioProcessor(config)
-        self.llm_client = LLMClient(model)
+        self.llm_client = LLMClient(
+            model,
+            upload_audio=config.upload_audio,
+            requests_per_minute=config.requests_per_minute
+        )
+        self.result_cache = ResultCache(config.result_cache_dir) if config.result_cache_dir else None
     
     def create_job(self, input_file: Path, output_file: Path, model: Optional[str] = None, context: Optional[str] = None) -> TranscriptionJob:
         """Create a new transcription job.
@@ -78,7 +163,9 @@ class TranscriptionEngine:
             return ""
         
         # Get the last minute of transcription
-        context = previous_result.get_last_minute_context(self.config.chunk_duration_minutes)
+        context = previous_result.get_last_minute_context(
+            self.config.chunk_duration_minutes, self.config.overlap_duration_minutes
+        )
         
         if context:
             logger.debug(f"Extracted context: {len(context)} characters")
@@ -91,13 +178,15 @@ class TranscriptionEngine:
             return fallback_context
     
     
-    def process_chunk(self, job: TranscriptionJob, chunk_index: int, progress_callback: Optional[Callable] = None) -> TranscriptionResult:
+    def process_chunk(self, job: TranscriptionJob, chunk_index: int, progress_callback: Optional[Callable] = None, use_context: bool = True, speaker_context: Optional[str] = None) -> TranscriptionResult:
         """Process a single chunk.
         
         Args:
             job: TranscriptionJob being processed
             chunk_index: Index of chunk to process
             progress_callback: Optional callback for progress updates
+            use_context: Whether to pass the previous chunk's transcription as context
+            speaker_context: Optional sample lines of speakers from earlier chunks
             
         Returns:
             TranscriptionResult for the chunk
@@ -109,11 +198,13 @@ class TranscriptionEngine:
         
         # Extract context from previous chunk if available
         context = None
-        if chunk_index > 0 and job.results:
-            # Find the previous result
-            previous_results = [r for r in job.results if r.chunk_index == chunk_index - 1]
-            if previous_results:
-                context = self.extract_context(previous_results[0])
+        if use_context and chunk_index > 0 and job.results:
+            # Results are appended in chunk order, so the previous one is normally last
+            previous_result = job.results[-1]
+            if previous_result.chunk_index != chunk_index - 1:
+                previous_result = next((r for r in job.results if r.chunk_index == chunk_index - 1), None)
+            if previous_result is not None:
+                context = self.extract_context(previous_result)
         
         # Convert audio to bytes
         audio_bytes = self.audio_processor.export_chunk_to_bytes(chunk)
@@ -122,8 +213,21 @@ class TranscriptionEngine:
         if progress_callback:
             progress_callback(chunk_index, len(job.chunks), f"Processing chunk {chunk_index + 1}/{len(job.chunks)}")
         
+        # Reuse an earlier transcription of the exact same request when caching is enabled
+        cache_key = None
+        if self.result_cache:
+            cache_key = ResultCache.make_key(self.llm_client.model, chunk, audio_bytes, context, job.context, speaker_context)
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached transcription for chunk {chunk_index + 1}")
+                # No LLM time was spent on this run, so don't report the stored timing
+                return cached_result.model_copy(update={"processing_time_seconds": 0.0})
+        
         # Transcribe chunk (pass job context and chunk context)
-        result = self.llm_client.transcribe_chunk(chunk, audio_bytes, context, job.context)
+        result = self.llm_client.transcribe_chunk(chunk, audio_bytes, context, job.context, speaker_context)
+        
+        if cache_key:
+            self.result_cache.put(cache_key, result)
         
         # Timestamps are already absolute from llm_client.parse_transcription_response
         return result
@@ -143,18 +247,27 @@ class TranscriptionEngine:
         job.started_at = datetime.now()
         
         try:
-            # Process each chunk
-            for chunk_index in range(len(job.chunks)):
-                logger.info(f"Processing chunk {chunk_index + 1}/{len(job.chunks)}")
-                
-                result = self.process_chunk(job, chunk_index, progress_callback)
-                job.results.append(result)
+            if self.config.max_concurrent_chunks > 1 and len(job.chunks) > 1:
+                if self.config.speaker_samples > 0:
+                    logger.warning("Speaker samples are only sent when chunks are processed sequentially; ignoring them")
+                self._process_chunks_concurrently(job, progress_callback)
+            else:
+                # Samples of every speaker so far, for speakers who left the last-minute context
+                speaker_cache = None
+                if self.config.speaker_samples > 0:
+                    speaker_cache = SpeakerCache(self.config.speaker_samples)
                 
-                # Log progress
-                if result.lines:
-                    logger.info(f"Chunk {chunk_index + 1} completed: {len(result.lines)} lines")
-                else:
-                    logger.warning(f"Chunk {chunk_index + 1} completed with no transcription")
+                # Process each chunk in order so every chunk gets its predecessor's context
+                for chunk_index in range(len(job.chunks)):
+                    logger.info(f"Processing chunk {chunk_index + 1}/{len(job.chunks)}")
+                    
+                    speaker_context = speaker_cache.build_context() if speaker_cache else None
+                    result = self.process_chunk(job, chunk_index, progress_callback, speaker_context=speaker_context)
+                    job.results.append(result)
+                    self._log_chunk_completed(chunk_index, result)
+                    
+                    if speaker_cache:
+                        speaker_cache.add_lines(result.lines)
             
             job.completed_at = datetime.now()
             logger.info(f"Transcription job completed in {job.total_duration_seconds:.2f}s")
@@ -166,6 +279,110 @@ class TranscriptionEngine:
         
         return job
     
+    def _process_chunks_concurrently(self, job: TranscriptionJob, progress_callback: Optional[Callable] = None) -> None:
+        """Transcribe all chunks of a job with a bounded number of requests in flight.
+        
+        Chunks are independent LLM requests here, so no previous-chunk context is
+        passed; overlapping content is still removed by timestamp during output.
+        
+        Args:
+            job: TranscriptionJob to process
+            progress_callback: Optional callback for progress updates
+        """
+        results = asyncio.run(self._process_chunks_async(job, progress_callback))
+        job.results.extend(results)
+    
+    async def _process_chunks_async(self, job: TranscriptionJob, progress_callback: Optional[Callable] = None) -> List[TranscriptionResult]:
+        """Pipeline chunk export and transcription on one event loop.
+        
+        A producer exports chunk audio in a worker thread into a bounded queue
+        while a fixed number of consumers keep LLM requests in flight, so
+        serializing the next chunk overlaps with waiting on the network and
+        only a bounded number of exported chunks is held in memory. Results
+        are reported through progress_callback as each one completes.
+        
+        Args:
+            job: TranscriptionJob to process
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            TranscriptionResults in chunk order
+        """
+        total_chunks = len(job.chunks)
+        max_concurrent = min(self.config.max_concurrent_chunks, total_chunks)
+        logger.info(f"Transcribing {total_chunks} chunks with up to {max_concurrent} concurrent requests (without chunk context)")
+        
+        # Bounded so exported audio never runs far ahead of the requests
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+        results: List[Optional[TranscriptionResult]] = [None] * total_chunks
+        completed = 0
+        
+        async def produce() -> None:
+            for position, chunk in enumerate(job.chunks):
+                audio_bytes = await asyncio.to_thread(self.audio_processor.export_chunk_to_bytes, chunk)
+                await queue.put((position, chunk, audio_bytes))
+            
+            # One stop marker per consumer
+            for _ in range(max_concurrent):
+                await queue.put(None)
+        
+        async def consume() -> None:
+            nonlocal completed
+            while (item := await queue.get()) is not None:
+                position, chunk, audio_bytes = item
+                result = await self._atranscribe_with_cache(chunk, audio_bytes, job.context)
+                results[position] = result
+                
+                completed += 1
+                self._log_chunk_completed(chunk.chunk_index, result)
+                if progress_callback:
+                    progress_callback(completed, total_chunks, f"Transcribed {completed}/{total_chunks} chunks")
+        
+        # TaskGroup cancels the remaining tasks as soon as one fails, e.g. on an export error
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(produce())
+                for _ in range(max_concurrent):
+                    task_group.create_task(consume())
+        except ExceptionGroup as group:
+            # Surface the original error, chained to the group so sibling failures stay visible
+            raise group.exceptions[0] from group
+        
+        return results
+    
+    async def _atranscribe_with_cache(self, chunk: ChunkData, audio_bytes: bytes, meeting_context: Optional[str]) -> TranscriptionResult:
+        """Transcribe a chunk without context, going through the result cache when enabled.
+        
+        Args:
+            chunk: ChunkData to transcribe
+            audio_bytes: Exported chunk audio
+            meeting_context: Optional context about the meeting
+            
+        Returns:
+            TranscriptionResult for the chunk
+        """
+        if not self.result_cache:
+            return await self.llm_client.atranscribe_chunk(chunk, audio_bytes, None, meeting_context)
+        
+        # Hashing the audio and file access stay off the event loop
+        cache_key = await asyncio.to_thread(ResultCache.make_key, self.llm_client.model, chunk, audio_bytes, None, meeting_context)
+        cached_result = await asyncio.to_thread(self.result_cache.get, cache_key)
+        if cached_result is not None:
+            logger.info(f"Using cached transcription for chunk {chunk.chunk_index + 1}")
+            # No LLM time was spent on this run, so don't report the stored timing
+            return cached_result.model_copy(update={"processing_time_seconds": 0.0})
+        
+        result = await self.llm_client.atranscribe_chunk(chunk, audio_bytes, None, meeting_context)
+        await asyncio.to_thread(self.result_cache.put, cache_key, result)
+        return result
+    
+    def _log_chunk_completed(self, chunk_index: int, result: TranscriptionResult) -> None:
+        """Log the outcome of a processed chunk."""
+        if result.lines:
+            logger.info(f"Chunk {chunk_index + 1} completed: {len(result.lines)} lines")
+        else:
+            logger.warning(f"Chunk {chunk_index + 1} completed with no transcription")
+    
     def transcribe_file(self, 
                        input_file: Path, 
                        output_file: Path, 
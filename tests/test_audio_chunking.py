@@ -1,7 +1,16 @@
-"""Tests for audio chunking functionality - basic validation tests only."""
+"""Tests for audio chunking functionality."""
+
+import io
+import wave
+from array import array
+from unittest.mock import Mock, patch
 
 import pytest
-from src.llm_transcribe.models import ChunkData
+from pydub import AudioSegment
+from pydub.exceptions import CouldntDecodeError
+
+from src.llm_transcribe.audio import AudioProcessor, build_wav_header, parse_wav_bytes
+from src.llm_transcribe.models import ChunkData, Config, PCMAudio
 
 
 class TestAudioChunking:
@@ -42,4 +51,192 @@ class TestAudioChunking:
                 start_time_seconds=-10.0,  # Negative start time
                 end_time_seconds=300.0,
                 audio_segment=None
-            )
\ No newline at end of file
+            )
+
+
+class TestChunkExport:
+    """Test chunk creation and WAV export from shared PCM data."""
+    
+    def test_chunks_share_pcm_and_export_wav(self):
+        """Test that chunks reference one PCM buffer and export valid WAV data."""
+        # 19 minutes of silence at a low sample rate keeps the test data small
+        silence = AudioSegment.silent(duration=19 * 60 * 1000 + 500, frame_rate=100)
+        audio = PCMAudio(data=silence.raw_data, sample_rate=100, channels=1, sample_width=2)
+        processor = AudioProcessor(Config(chunk_duration_minutes=10, overlap_duration_minutes=1))
+        
+        chunks = processor.create_chunks(audio)
+        
+        assert [(c.start_time_seconds, c.end_time_seconds) for c in chunks] == [
+            (0.0, 600.0), (540.0, 1140.0), (1080.0, 1140.5)
+        ]
+        assert all(c.audio is chunks[0].audio for c in chunks)
+        
+        wav_bytes = processor.export_chunk_to_bytes(chunks[1])
+        with wave.open(io.BytesIO(wav_bytes)) as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getframerate() == 100
+            assert wav.getsampwidth() == 2
+            assert wav.getnframes() == 600 * 100
+        
+        # Same bytes as pydub's own WAV export of the sliced segment
+        reference = io.BytesIO()
+        silence[540 * 1000:1140 * 1000].export(reference, format="wav")
+        assert wav_bytes == reference.getvalue()
+    
+    def test_export_without_audio_raises(self):
+        """Test that exporting a chunk without audio data raises ValueError."""
+        processor = AudioProcessor(Config())
+        chunk = ChunkData(chunk_index=0, start_time_seconds=0.0, end_time_seconds=600.0)
+        
+        with pytest.raises(ValueError):
+            processor.export_chunk_to_bytes(chunk)
+
+
+class TestAudioInfo:
+    """Test audio information derived from PCM metadata."""
+    
+    def test_get_audio_info(self):
+        """Test that audio info is computed from the PCM format."""
+        audio = PCMAudio(data=b"\x00" * 64000, sample_rate=16000, channels=1, sample_width=2)
+        processor = AudioProcessor(Config())
+        
+        assert processor.get_audio_info(audio) == {
+            "duration_seconds": 2.0,
+            "sample_rate": 16000,
+            "channels": 1,
+            "sample_width": 2,
+            "frame_count": 32000,
+            "max_possible_amplitude": 32768.0
+        }
+
+
+class TestWavParsing:
+    """Test parsing of decoder WAV output."""
+    
+    def test_parse_wav_with_placeholder_sizes(self):
+        """Test parsing a piped WAV stream whose sizes were never filled in."""
+        pcm = bytes(range(200)) * 4  # 800 bytes = 200 stereo frames
+        header = bytearray(build_wav_header(len(pcm), 8000, 2, 2))
+        
+        # ffmpeg writing to a pipe leaves placeholder sizes in the header
+        header[4:8] = b"\xff\xff\xff\xff"
+        header[40:44] = b"\xff\xff\xff\xff"
+        
+        audio = parse_wav_bytes(bytes(header) + pcm)
+        
+        assert audio.data == pcm
+        assert audio.sample_rate == 8000
+        assert audio.channels == 2
+        assert audio.sample_width == 2
+        assert audio.frame_count == 200
+    
+    def test_parse_invalid_data_raises(self):
+        """Test that non-WAV data is rejected."""
+        with pytest.raises(CouldntDecodeError):
+            parse_wav_bytes(b"not a wav file at all")
+
+
+class TestAudioLoading:
+    """Test audio decoding through ffmpeg."""
+    
+    def test_load_audio_resamples_to_configured_format(self, temp_dir):
+        """Test that ffmpeg is asked for the configured rate and channels."""
+        input_file = temp_dir / "meeting.mp3"
+        input_file.touch()
+        pcm = b"\x00\x01" * 16000
+        decoded = Mock(returncode=0, stdout=build_wav_header(len(pcm), 16000, 1, 2) + pcm, stderr=b"")
+        
+        processor = AudioProcessor(Config())
+        with patch("src.llm_transcribe.audio.subprocess.run", return_value=decoded) as run:
+            audio = processor.load_audio(input_file)
+        
+        command = run.call_args.args[0]
+        assert command[0] == "ffmpeg"
+        assert command[command.index("-ar") + 1] == "16000"
+        assert command[command.index("-ac") + 1] == "1"
+        assert command[-1] == "pipe:1"
+        assert audio.duration_seconds == 1.0
+    
+    def test_load_audio_keeps_source_format_when_disabled(self, temp_dir):
+        """Test that no resampling arguments are passed when disabled."""
+        input_file = temp_dir / "meeting.wav"
+        input_file.touch()
+        pcm = b"\x00\x00" * 4
+        decoded = Mock(returncode=0, stdout=build_wav_header(len(pcm), 44100, 2, 2) + pcm, stderr=b"")
+        
+        processor = AudioProcessor(Config(audio_sample_rate=None, audio_channels=None))
+        with patch("src.llm_transcribe.audio.subprocess.run", return_value=decoded) as run:
+            processor.load_audio(input_file)
+        
+        command = run.call_args.args[0]
+        assert "-ar" not in command
+        assert "-ac" not in command
+    
+    def test_load_wav_reads_in_process(self, temp_dir):
+        """Test that a WAV file at the target rate is mixed down without ffmpeg."""
+        input_file = temp_dir / "stereo.wav"
+        with wave.open(str(input_file), 'wb') as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            # Left and right channels average to 150 and -150
+            wav_file.writeframes(b"".join(
+                value.to_bytes(2, 'little', signed=True)
+                for value in (100, 200, -100, -200) * 8000
+            ))
+        
+        processor = AudioProcessor(Config())
+        with patch("src.llm_transcribe.audio.subprocess.run") as run:
+            audio = processor.load_audio(input_file)
+        
+        run.assert_not_called()
+        assert audio.channels == 1
+        assert audio.sample_rate == 16000
+        assert audio.duration_seconds == 1.0
+        assert array('h', audio.data)[:2].tolist() == [150, -150]
+    
+    def test_load_wav_converts_8_bit_samples(self, temp_dir):
+        """Test that unsigned 8-bit WAV samples are converted to signed 16-bit."""
+        input_file = temp_dir / "8bit.wav"
+        with wave.open(str(input_file), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(1)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(bytes([128, 255, 0]))
+        
+        processor = AudioProcessor(Config())
+        with patch("src.llm_transcribe.audio.subprocess.run") as run:
+            audio = processor.load_audio(input_file)
+        
+        run.assert_not_called()
+        assert audio.sample_width == 2
+        assert array('h', audio.data).tolist() == [0, 127 << 8, -128 << 8]
+    
+    def test_load_wav_needing_resampling_uses_ffmpeg(self, temp_dir):
+        """Test that WAV files at another sample rate are still resampled by ffmpeg."""
+        input_file = temp_dir / "cd_quality.wav"
+        with wave.open(str(input_file), 'wb') as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(b"\x00" * 4 * 441)
+        pcm = b"\x00\x00" * 160
+        decoded = Mock(returncode=0, stdout=build_wav_header(len(pcm), 16000, 1, 2) + pcm, stderr=b"")
+        
+        processor = AudioProcessor(Config())
+        with patch("src.llm_transcribe.audio.subprocess.run", return_value=decoded) as run:
+            audio = processor.load_audio(input_file)
+        
+        run.assert_called_once()
+        assert audio.sample_rate == 16000
+    
+    def test_load_audio_decode_failure(self, temp_dir):
+        """Test that ffmpeg errors surface as CouldntDecodeError."""
+        input_file = temp_dir / "broken.mp3"
+        input_file.touch()
+        failed = Mock(returncode=1, stdout=b"", stderr=b"Invalid data found when processing input")
+        
+        processor = AudioProcessor(Config())
+        with patch("src.llm_transcribe.audio.subprocess.run", return_value=failed):
+            with pytest.raises(CouldntDecodeError):
+                processor.load_audio(input_file)
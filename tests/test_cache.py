@@ -0,0 +1,62 @@
+"""Tests for the on-disk result cache."""
+
+import pytest
+
+from src.llm_transcribe.cache import ResultCache, default_cache_dir
+from src.llm_transcribe.models import ChunkData, TranscriptionLine, TranscriptionResult
+
+
+def make_chunk(index=0, start=0.0):
+    """Create a chunk without audio."""
+    return ChunkData(chunk_index=index, start_time_seconds=start, end_time_seconds=start + 600.0)
+
+
+class TestResultCache:
+    """Test storing and loading chunk results."""
+    
+    def test_round_trip(self, temp_dir, sample_transcription_result):
+        """Test that a stored result is loaded back unchanged."""
+        cache = ResultCache(temp_dir / "cache")
+        key = ResultCache.make_key("test-model", make_chunk(), b"audio")
+        
+        assert cache.get(key) is None
+        cache.put(key, sample_transcription_result)
+        
+        loaded = cache.get(key)
+        assert loaded == sample_transcription_result
+        assert loaded.text == sample_transcription_result.text
+    
+    def test_key_depends_on_request(self):
+        """Test that any change to the request changes the key."""
+        base = ResultCache.make_key("test-model", make_chunk(), b"audio", "context")
+        
+        assert ResultCache.make_key("test-model", make_chunk(), b"audio", "context") == base
+        assert ResultCache.make_key("other-model", make_chunk(), b"audio", "context") != base
+        assert ResultCache.make_key("test-model", make_chunk(1, 540.0), b"audio", "context") != base
+        assert ResultCache.make_key("test-model", make_chunk(), b"other audio", "context") != base
+        assert ResultCache.make_key("test-model", make_chunk(), b"audio", None) != base
+        assert ResultCache.make_key("test-model", make_chunk(), b"audio", "context", "meeting") != base
+    
+    def test_failed_results_are_not_stored(self, temp_dir):
+        """Test that chunks without lines are retried instead of cached."""
+        cache = ResultCache(temp_dir)
+        key = ResultCache.make_key("test-model", make_chunk(), b"audio")
+        failed = TranscriptionResult(chunk_index=0, lines=[], raw_response="Error: timeout", model_used="test-model", processing_time_seconds=1.0)
+        
+        cache.put(key, failed)
+        
+        assert cache.get(key) is None
+    
+    def test_corrupt_entry_is_a_miss(self, temp_dir):
+        """Test that an unreadable entry is ignored."""
+        cache = ResultCache(temp_dir)
+        key = ResultCache.make_key("test-model", make_chunk(), b"audio")
+        (temp_dir / f"{key}.json").write_text("not json", encoding='utf-8')
+        
+        assert cache.get(key) is None
+    
+    def test_default_cache_dir_honours_xdg(self, temp_dir, monkeypatch):
+        """Test that XDG_CACHE_HOME moves the default directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+        
+        assert default_cache_dir() == temp_dir / "llm-transcribe"
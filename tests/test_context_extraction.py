@@ -250,4 +250,26 @@ class TestContextExtraction:
         # and then converted to relative timestamps (starting from [00:00:00])
         assert "Bob: Context line 1" in context
         assert "Alice: Context line 2" in context
-        assert "Bob: Context line 3" in context
\ No newline at end of file
+        assert "Bob: Context line 3" in context
+    
+    def test_get_last_minute_context_longer_overlap(self):
+        """Test that chunk offsets account for overlaps longer than one minute."""
+        # With 2 minute overlap, chunk 1 covers 8-18 minutes
+        lines = [
+            TranscriptionLine(timestamp=480.0, speaker="Alice", text="Start of chunk"),    # 8:00
+            TranscriptionLine(timestamp=1000.0, speaker="Bob", text="Before last minute"), # 16:40
+            TranscriptionLine(timestamp=1030.0, speaker="Alice", text="Late in chunk"),    # 17:10
+        ]
+        
+        result = TranscriptionResult(
+            chunk_index=1,
+            lines=lines,
+            raw_response="mock response",
+            model_used="test-model",
+            processing_time_seconds=1.0
+        )
+        
+        # Last minute starts at 17:00 (1020 seconds)
+        context = result.get_last_minute_context(chunk_duration_minutes=10, overlap_duration_minutes=2)
+        
+        assert context == "[00:17:10] Alice: Late in chunk"
@@ -128,6 +128,44 @@ class TestOutputFormatting:
         
         assert formatted == "\n".join(expected_lines)
 
+    
+    def test_final_transcription_skips_failed_chunks(self, temp_dir):
+        """Test that chunks without lines don't leave blank lines in the final transcription."""
+        lines1 = [TranscriptionLine(timestamp=30.0, speaker="Alice", text="First chunk")]
+        lines3 = [TranscriptionLine(timestamp=1110.0, speaker="Bob", text="Third chunk")]
+        
+        results = [
+            TranscriptionResult(chunk_index=0, lines=lines1, raw_response="", model_used="test", processing_time_seconds=1.0),
+            TranscriptionResult(chunk_index=1, lines=[], raw_response="", model_used="test", processing_time_seconds=1.0),
+            TranscriptionResult(chunk_index=2, lines=lines3, raw_response="", model_used="test", processing_time_seconds=1.0),
+        ]
+        
+        input_file = temp_dir / "test.mp3"
+        input_file.touch()
+        
+        job = TranscriptionJob(
+            input_file=input_file,
+            output_file=temp_dir / "test.txt",
+            model="test-model",
+            config=Config(chunk_duration_minutes=10, overlap_duration_minutes=1),
+            results=results
+        )
+        
+        assert job.final_transcription == "[00:00:30] Alice: First chunk\n[00:18:30] Bob: Third chunk"
+    
+    def test_result_text_follows_updated_lines(self):
+        """Test that a copied result with different lines doesn't return stale text."""
+        result = TranscriptionResult(
+            chunk_index=0,
+            lines=[TranscriptionLine(timestamp=30.0, speaker="Alice", text="Hello")],
+            raw_response="",
+            model_used="test",
+            processing_time_seconds=1.0
+        )
+        assert result.text == "[00:00:30] Alice: Hello"
+        
+        assert result.model_copy(update={"lines": []}).text == ""
+
 
 class TestDeduplication:
     """Test deduplication functionality for overlapping chunks."""
@@ -277,6 +315,94 @@ class TestDeduplication:
         
         assert deduplicated == expected_lines
 
+    
+    def test_deduplicate_reworded_repeat_in_overlap(self, temp_dir):
+        """Test that a repeat with shifted timestamp and punctuation in the overlap is dropped."""
+        handler = OutputHandler()
+        
+        lines1 = [
+            TranscriptionLine(timestamp=30.0, speaker="Alice", text="Hello everyone"),
+            TranscriptionLine(timestamp=570.0, speaker="Bob", text="Let's move on.")
+        ]
+        
+        # Chunk 1 starts at 9:00; the LLM placed Bob's line 5 seconds later and dropped the period
+        lines2 = [
+            TranscriptionLine(timestamp=575.0, speaker="Bob", text="let's  move on"),
+            TranscriptionLine(timestamp=590.0, speaker="Alice", text="Sure."),
+            TranscriptionLine(timestamp=700.0, speaker="Bob", text="Let's move on.")  # Outside the overlap, kept
+        ]
+        
+        result1 = TranscriptionResult(chunk_index=0, lines=lines1, raw_response="", model_used="test", processing_time_seconds=1.0)
+        result2 = TranscriptionResult(chunk_index=1, lines=lines2, raw_response="", model_used="test", processing_time_seconds=1.0)
+        
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1)
+        
+        input_file = temp_dir / "test.mp3"
+        output_file = temp_dir / "test.txt"
+        input_file.touch()
+        
+        job = TranscriptionJob(
+            input_file=input_file,
+            output_file=output_file,
+            model="test-model",
+            config=config,
+            results=[result1, result2]
+        )
+        
+        deduplicated = handler.deduplicate_overlapping_content(job)
+        
+        expected_lines = [
+            "[00:00:30] Alice: Hello everyone",
+            "[00:09:30] Bob: Let's move on.",
+            "[00:09:50] Alice: Sure.",
+            "[00:11:40] Bob: Let's move on."
+        ]
+        
+        assert deduplicated == expected_lines
+    
+    def test_deduplicate_keeps_genuine_repeat_in_overlap(self, temp_dir):
+        """Test that the same short line said again well apart in the overlap is kept."""
+        handler = OutputHandler()
+        
+        lines1 = [
+            TranscriptionLine(timestamp=30.0, speaker="Alice", text="Hello everyone"),
+            TranscriptionLine(timestamp=560.0, speaker="Bob", text="Okay.")
+        ]
+        
+        # Bob says "Okay." again 15 seconds later, after chunk 0's last line
+        lines2 = [
+            TranscriptionLine(timestamp=560.0, speaker="Bob", text="Okay."),  # Duplicate
+            TranscriptionLine(timestamp=575.0, speaker="Bob", text="Okay."),
+            TranscriptionLine(timestamp=600.0, speaker="Alice", text="Great")
+        ]
+        
+        result1 = TranscriptionResult(chunk_index=0, lines=lines1, raw_response="", model_used="test", processing_time_seconds=1.0)
+        result2 = TranscriptionResult(chunk_index=1, lines=lines2, raw_response="", model_used="test", processing_time_seconds=1.0)
+        
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1)
+        
+        input_file = temp_dir / "test.mp3"
+        output_file = temp_dir / "test.txt"
+        input_file.touch()
+        
+        job = TranscriptionJob(
+            input_file=input_file,
+            output_file=output_file,
+            model="test-model",
+            config=config,
+            results=[result1, result2]
+        )
+        
+        deduplicated = handler.deduplicate_overlapping_content(job)
+        
+        expected_lines = [
+            "[00:00:30] Alice: Hello everyone",
+            "[00:09:20] Bob: Okay.",
+            "[00:09:35] Bob: Okay.",
+            "[00:10:00] Alice: Great"
+        ]
+        
+        assert deduplicated == expected_lines
 
 class TestJSONExport:
     """Test JSON export functionality."""
@@ -475,6 +601,32 @@ class TestFileWriting:
         ]
         assert content == "\n".join(expected_lines)
     
+    def test_write_transcription_file_empty_chunk_between(self, temp_dir):
+        """Test that a chunk without lines doesn't leave a blank line in the file."""
+        handler = OutputHandler()
+        
+        results = [
+            TranscriptionResult(chunk_index=0, lines=[TranscriptionLine(timestamp=30.0, speaker="Alice", text="Hello")], raw_response="", model_used="test", processing_time_seconds=1.0),
+            TranscriptionResult(chunk_index=1, lines=[], raw_response="", model_used="test", processing_time_seconds=1.0),
+            TranscriptionResult(chunk_index=2, lines=[TranscriptionLine(timestamp=1110.0, speaker="Bob", text="Bye")], raw_response="", model_used="test", processing_time_seconds=1.0),
+        ]
+        
+        input_file = temp_dir / "input.mp3"
+        output_file = temp_dir / "output.txt"
+        input_file.touch()
+        
+        job = TranscriptionJob(
+            input_file=input_file,
+            output_file=output_file,
+            model="test-model",
+            config=Config(chunk_duration_minutes=10, overlap_duration_minutes=1),
+            results=results
+        )
+        
+        for deduplicate in (True, False):
+            handler.write_transcription_file(job, deduplicate=deduplicate)
+            assert output_file.read_text(encoding='utf-8') == "[00:00:30] Alice: Hello\n[00:18:30] Bob: Bye"
+    
     def test_export_job_results_json(self, temp_dir):
         """Test JSON export to file."""
         handler = OutputHandler()
@@ -508,4 +660,35 @@ class TestFileWriting:
         
         assert data["input_file"] == str(input_file)
         assert len(data["results"]) == 1
-        assert data["results"][0]["lines"][0]["timestamp"] == "[00:00:30]"
\ No newline at end of file
+        assert data["results"][0]["lines"][0]["timestamp"] == "[00:00:30]"
+
+
+class TestSummaryReport:
+    """Test summary report generation."""
+    
+    def test_summary_report_without_chunks(self, temp_dir):
+        """Test that a completed job without audio chunks doesn't divide by zero."""
+        from datetime import datetime
+        
+        handler = OutputHandler()
+        
+        input_file = temp_dir / "input.mp3"
+        input_file.touch()
+        
+        result = TranscriptionResult(chunk_index=0, lines=[], raw_response="", model_used="test", processing_time_seconds=0.0)
+        job = TranscriptionJob(
+            input_file=input_file,
+            output_file=temp_dir / "output.txt",
+            model="test-model",
+            config=Config(chunk_duration_minutes=10, overlap_duration_minutes=1),
+            results=[result],
+            started_at=datetime(2024, 1, 1, 12, 0, 0),
+            completed_at=datetime(2024, 1, 1, 12, 0, 5)
+        )
+        
+        report = handler.create_summary_report(job)
+        
+        assert "- Duration: 0.00 seconds (0.00 minutes)" in report
+        assert "- Audio/Processing Ratio: 0.00x" in report
+        assert "- Real-time Factor: 0.00" in report
+        assert "- Failed Chunks: 1" in report
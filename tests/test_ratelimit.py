@@ -0,0 +1,57 @@
+"""Tests for the async request rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.llm_transcribe.ratelimit import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Test token bucket pacing."""
+    
+    def test_requests_are_spaced_at_the_configured_rate(self):
+        """Test that requests beyond the burst wait for the bucket to refill."""
+        limiter = AsyncRateLimiter(requests_per_minute=1200)  # One request every 50ms
+        
+        async def acquire_all():
+            await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        
+        start = time.monotonic()
+        asyncio.run(acquire_all())
+        elapsed = time.monotonic() - start
+        
+        # First request is immediate, the other four wait ~50ms each
+        assert elapsed >= 0.19
+        assert elapsed < 1.0
+    
+    def test_burst_requests_start_immediately(self):
+        """Test that a full bucket lets the burst through without waiting."""
+        limiter = AsyncRateLimiter(requests_per_minute=60, burst=3)
+        
+        async def acquire_burst():
+            await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        
+        start = time.monotonic()
+        asyncio.run(acquire_burst())
+        
+        assert time.monotonic() - start < 0.1
+    
+    def test_limiter_can_be_reused_across_event_loops(self):
+        """Test that one limiter works across separate asyncio.run calls."""
+        limiter = AsyncRateLimiter(requests_per_minute=6000)
+        
+        async def acquire_twice():
+            await asyncio.gather(limiter.acquire(), limiter.acquire())
+        
+        asyncio.run(acquire_twice())
+        asyncio.run(acquire_twice())
+    
+    def test_invalid_settings_raise(self):
+        """Test that non-positive rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(requests_per_minute=0)
+        
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(requests_per_minute=60, burst=0)
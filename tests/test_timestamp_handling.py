@@ -1,6 +1,11 @@
 """Tests for timestamp handling and conversion logic."""
 
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
+from pydantic import ValidationError
 from unittest.mock import Mock, patch
 from typing import List
 
@@ -52,38 +57,38 @@ class TestTimestampHandling:
         expected = "[00:15] Alice: First\n[00:30] Bob: Second\n[00:45] Alice: Third"
         assert result == expected
     
-    def test_convert_relative_to_absolute_seconds(self):
-        """Test converting relative timestamp to absolute seconds."""
+    def test_relative_timestamps_converted_to_absolute_seconds(self):
+        """Test converting relative timestamps to absolute seconds while parsing."""
         client = LLMClient()
         
-        # Test various relative timestamps
-        assert client._convert_relative_to_absolute_seconds("[00:30]", 540.0) == 570.0
-        assert client._convert_relative_to_absolute_seconds("[01:15]", 540.0) == 615.0
-        assert client._convert_relative_to_absolute_seconds("[02:00]", 540.0) == 660.0
+        response = "[00:30] Alice: One\n[01:15] Bob: Two\n[02:00] Alice: Three"
+        lines = client.parse_transcription_response(response, 540.0)
+        
+        assert [line.timestamp for line in lines] == [570.0, 615.0, 660.0]
     
-    def test_convert_relative_to_absolute_seconds_zero(self):
+    def test_relative_timestamp_zero(self):
         """Test converting zero relative timestamp."""
         client = LLMClient()
         
-        result = client._convert_relative_to_absolute_seconds("[00:00]", 540.0)
-        assert result == 540.0
+        lines = client.parse_transcription_response("[00:00] Alice: Hello", 540.0)
+        assert lines[0].timestamp == 540.0
     
-    def test_convert_relative_to_absolute_seconds_invalid(self):
-        """Test handling invalid timestamp format."""
+    def test_line_without_timestamp_is_skipped(self):
+        """Test that a line without any timestamp produces no transcription line."""
         client = LLMClient()
         
-        # Should return chunk start time for invalid format
-        result = client._convert_relative_to_absolute_seconds("invalid", 540.0)
-        assert result == 540.0
+        lines = client.parse_transcription_response("invalid", 540.0)
+        assert lines == []
     
-    def test_convert_relative_to_absolute_seconds_single_digit_minutes(self):
-        """Test converting relative timestamp with single digit minutes [M:SS]."""
+    def test_relative_timestamps_single_digit_minutes(self):
+        """Test converting relative timestamps with single digit minutes [M:SS]."""
         client = LLMClient()
         
-        # Test single digit minute timestamps
-        assert client._convert_relative_to_absolute_seconds("[1:03]", 540.0) == 603.0  # 540 + 63
-        assert client._convert_relative_to_absolute_seconds("[5:30]", 540.0) == 870.0  # 540 + 330
-        assert client._convert_relative_to_absolute_seconds("[9:45]", 540.0) == 1125.0  # 540 + 585
+        response = "[1:03] Alice: One\n[5:30] Bob: Two\n[9:45] Alice: Three"
+        lines = client.parse_transcription_response(response, 540.0)
+        
+        # 540 + 63, 540 + 330, 540 + 585
+        assert [line.timestamp for line in lines] == [603.0, 870.0, 1125.0]
     
     def test_parse_transcription_response_basic(self):
         """Test parsing basic transcription response."""
@@ -171,6 +176,30 @@ class TestTimestampHandling:
         assert lines[0].speaker == "Alice"
         assert lines[1].speaker == "Bob"
     
+    def test_parse_transcription_response_malformed_lines_between_and_after(self):
+        """Test that malformed lines anywhere in the response are salvaged in order."""
+        client = LLMClient()
+        
+        response = (
+            "Here is the transcript:\n"
+            "  [00:10] Alice: Hi  \n"
+            "[00:20] Bob says hi back\n"
+            "[00:30] Alice: Great\n"
+            "[00:40]\n"
+            "Thanks for listening"
+        )
+        
+        with patch('src.llm_transcribe.llm_client.logger') as mock_logger:
+            lines = client.parse_transcription_response(response, 0.0)
+        
+        assert mock_logger.warning.call_count == 4
+        assert [(line.timestamp, line.speaker, line.text) for line in lines] == [
+            (10.0, "Alice", "Hi"),
+            (20.0, "Unknown", "Bob says hi back"),
+            (30.0, "Alice", "Great"),
+            (40.0, "Unknown", ""),
+        ]
+    
     def test_parse_transcription_response_single_digit_minutes(self):
         """Test parsing response with single digit minutes [M:SS] format."""
         client = LLMClient()
@@ -268,4 +297,53 @@ class TestTimestampIntegration:
         
         assert line.timestamp == 0.0
         assert line.formatted_timestamp == "[00:00:00]"
-        assert str(line) == "[00:00:00] Alice: Start"
\ No newline at end of file
+        assert str(line) == "[00:00:00] Alice: Start"
+    
+    def test_line_is_immutable(self):
+        """Test that a line cannot change after it is created."""
+        line = TranscriptionLine(timestamp=90.0, speaker="Bob", text="Hi")
+        
+        with pytest.raises(FrozenInstanceError):
+            line.text = "Changed"
+        assert str(line) == "[00:01:30] Bob: Hi"
+    
+    def test_line_formatted_once(self):
+        """Test that the formatted line is built at construction and reused."""
+        line = TranscriptionLine(timestamp=90.0, speaker="Bob", text="Hi")
+        
+        assert line.formatted == "[00:01:30] Bob: Hi"
+        assert str(line) is line.formatted
+        # The derived string doesn't take part in equality or the repr
+        assert line == TranscriptionLine(timestamp=90.0, speaker="Bob", text="Hi")
+        assert "formatted" not in repr(line)
+    
+    def test_line_validation_and_copying(self):
+        """Test that lines reject negative timestamps and survive copying."""
+        with pytest.raises(ValueError, match="non-negative"):
+            TranscriptionLine(timestamp=-1.0, speaker="Bob", text="Hi")
+        
+        line = TranscriptionLine(timestamp=90.0, speaker="Bob", text="Hi")
+        for restored in (pickle.loads(pickle.dumps(line)), copy.deepcopy(line)):
+            assert restored == line
+            assert str(restored) == "[00:01:30] Bob: Hi"
+    
+    def test_parsed_lines_not_revalidated_by_result(self):
+        """Test that parsed lines are stored in a result as-is, without a validation copy."""
+        client = LLMClient()
+        lines = client.parse_transcription_response("[00:30] Alice: Hello", 540.0)
+        
+        result = TranscriptionResult(chunk_index=1, lines=lines, raw_response="", model_used="test", processing_time_seconds=1.0)
+        
+        assert result.lines[0] is lines[0]
+    
+    def test_lines_validated_when_loaded_into_result(self):
+        """Test that pydantic coerces and validates line fields inside a result."""
+        data = {"chunk_index": 0, "raw_response": "", "model_used": "test", "processing_time_seconds": 1.0}
+        
+        result = TranscriptionResult.model_validate({**data, "lines": [{"timestamp": "90", "speaker": "Bob", "text": "Hi"}]})
+        assert result.lines == [TranscriptionLine(timestamp=90.0, speaker="Bob", text="Hi")]
+        
+        with pytest.raises(ValidationError):
+            TranscriptionResult.model_validate({**data, "lines": [{"timestamp": "soon", "speaker": "Bob", "text": "Hi"}]})
+        with pytest.raises(ValidationError):
+            TranscriptionResult.model_validate({**data, "lines": [{"timestamp": -1.0, "speaker": "Bob", "text": "Hi"}]})
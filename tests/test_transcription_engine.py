@@ -0,0 +1,230 @@
+"""Tests for chunk orchestration in the transcription engine."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.llm_transcribe.models import ChunkData, Config, TranscriptionJob, TranscriptionLine, TranscriptionResult
+from src.llm_transcribe.transcriber import SpeakerCache, TranscriptionEngine
+
+
+def make_job(temp_dir, config, num_chunks):
+    """Create a job with evenly spaced chunks."""
+    input_file = temp_dir / "test.mp3"
+    input_file.touch()
+    
+    chunks = [
+        ChunkData(
+            chunk_index=i,
+            start_time_seconds=i * 540.0,
+            end_time_seconds=i * 540.0 + 600.0,
+            audio_segment=None
+        )
+        for i in range(num_chunks)
+    ]
+    
+    return TranscriptionJob(
+        input_file=input_file,
+        output_file=temp_dir / "test.txt",
+        model="test-model",
+        config=config,
+        chunks=chunks
+    )
+
+
+def make_engine(config):
+    """Create an engine whose audio export and LLM calls are mocked."""
+    engine = TranscriptionEngine(config, model="test-model")
+    engine.audio_processor.export_chunk_to_bytes = Mock(return_value=b"audio")
+    
+    def fake_transcribe(chunk, audio_bytes, context=None, meeting_context=None, speaker_context=None):
+        return TranscriptionResult(
+            chunk_index=chunk.chunk_index,
+            lines=[TranscriptionLine(timestamp=chunk.start_time_seconds + 30, speaker="Alice", text=f"Chunk {chunk.chunk_index}")],
+            raw_response=context or "",
+            model_used="test-model",
+            processing_time_seconds=0.1
+        )
+    
+    async def fake_atranscribe(chunk, audio_bytes, context=None, meeting_context=None):
+        # Finish later chunks first to exercise result ordering
+        await asyncio.sleep(0.01 * (10 - chunk.chunk_index))
+        return fake_transcribe(chunk, audio_bytes, context, meeting_context)
+    
+    engine.llm_client.transcribe_chunk = Mock(side_effect=fake_transcribe)
+    engine.llm_client.atranscribe_chunk = AsyncMock(side_effect=fake_atranscribe)
+    return engine
+
+
+class TestProcessJob:
+    """Test serial and concurrent job processing."""
+    
+    def test_serial_processing_passes_previous_context(self, temp_dir):
+        """Test that serial processing feeds each chunk its predecessor's context."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1)
+        engine = make_engine(config)
+        job = make_job(temp_dir, config, 3)
+        
+        engine.process_job(job)
+        
+        assert [r.chunk_index for r in job.results] == [0, 1, 2]
+        contexts = [call.args[2] for call in engine.llm_client.transcribe_chunk.call_args_list]
+        assert contexts[0] is None
+        assert contexts[1] is not None
+        assert contexts[2] is not None
+    
+    def test_serial_processing_passes_speaker_samples(self, temp_dir):
+        """Test that speaker samples from earlier chunks are passed when enabled."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, speaker_samples=1)
+        engine = make_engine(config)
+        job = make_job(temp_dir, config, 3)
+        
+        engine.process_job(job)
+        
+        speaker_contexts = [call.args[4] for call in engine.llm_client.transcribe_chunk.call_args_list]
+        assert speaker_contexts == ["", "Alice: Chunk 0", "Alice: Chunk 1"]
+    
+    def test_concurrent_processing_warns_about_speaker_samples(self, temp_dir, caplog):
+        """Test that speaker samples requested in concurrent mode are reported as ignored."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, max_concurrent_chunks=2, speaker_samples=2)
+        engine = make_engine(config)
+        
+        with caplog.at_level("WARNING"):
+            engine.process_job(make_job(temp_dir, config, 2))
+        
+        assert "Speaker samples are only sent when chunks are processed sequentially" in caplog.text
+    
+    def test_cached_results_skip_the_llm(self, temp_dir):
+        """Test that a second run of the same job is served from the result cache."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, result_cache_dir=temp_dir / "cache")
+        engine = make_engine(config)
+        
+        first_job = engine.process_job(make_job(temp_dir, config, 2))
+        second_job = engine.process_job(make_job(temp_dir, config, 2))
+        
+        assert engine.llm_client.transcribe_chunk.call_count == 2
+        assert [r.text for r in second_job.results] == [r.text for r in first_job.results]
+        # No LLM time was spent on the second run
+        assert [r.processing_time_seconds for r in second_job.results] == [0.0, 0.0]
+    
+    def test_concurrent_processing_uses_result_cache(self, temp_dir):
+        """Test that the concurrent pipeline also reads and fills the result cache."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, max_concurrent_chunks=2, result_cache_dir=temp_dir / "cache")
+        engine = make_engine(config)
+        
+        engine.process_job(make_job(temp_dir, config, 3))
+        job = engine.process_job(make_job(temp_dir, config, 3))
+        
+        assert engine.llm_client.atranscribe_chunk.await_count == 3
+        assert [r.chunk_index for r in job.results] == [0, 1, 2]
+        assert all(r.processing_time_seconds == 0.0 for r in job.results)
+    
+    def test_concurrent_processing_keeps_chunk_order(self, temp_dir):
+        """Test that concurrent processing returns results in chunk order without context."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, max_concurrent_chunks=3)
+        engine = make_engine(config)
+        job = make_job(temp_dir, config, 5)
+        progress = Mock()
+        
+        engine.process_job(job, progress)
+        
+        assert [r.chunk_index for r in job.results] == [0, 1, 2, 3, 4]
+        assert engine.llm_client.atranscribe_chunk.await_count == 5
+        assert all(call.args[2] is None for call in engine.llm_client.atranscribe_chunk.call_args_list)
+        engine.llm_client.transcribe_chunk.assert_not_called()
+        assert progress.call_count == 5
+        assert job.is_completed
+    
+    def test_concurrent_processing_limits_requests_in_flight(self, temp_dir):
+        """Test that no more than max_concurrent_chunks requests run at once."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, max_concurrent_chunks=2)
+        engine = make_engine(config)
+        job = make_job(temp_dir, config, 6)
+        
+        in_flight = 0
+        peak = 0
+        
+        async def tracked_atranscribe(chunk, audio_bytes, context=None, meeting_context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TranscriptionResult(
+                chunk_index=chunk.chunk_index,
+                lines=[],
+                raw_response="",
+                model_used="test-model",
+                processing_time_seconds=0.01
+            )
+        
+        engine.llm_client.atranscribe_chunk = AsyncMock(side_effect=tracked_atranscribe)
+        engine.process_job(job)
+        
+        assert peak == 2
+        assert [r.chunk_index for r in job.results] == [0, 1, 2, 3, 4, 5]
+    
+    def test_concurrent_processing_propagates_export_errors(self, temp_dir):
+        """Test that a failing chunk export aborts the job instead of hanging."""
+        config = Config(chunk_duration_minutes=10, overlap_duration_minutes=1, max_concurrent_chunks=2)
+        engine = make_engine(config)
+        engine.audio_processor.export_chunk_to_bytes = Mock(side_effect=[b"audio", ValueError("no audio"), b"audio"])
+        job = make_job(temp_dir, config, 3)
+        
+        with pytest.raises(ValueError, match="no audio") as exc_info:
+            engine.process_job(job)
+        
+        # The TaskGroup's exception group is kept as the cause
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+        assert job.completed_at is not None
+        assert job.results == []
+    
+    def test_max_concurrent_chunks_validation(self):
+        """Test that concurrency must be at least 1."""
+        with pytest.raises(ValueError):
+            Config(max_concurrent_chunks=0)
+
+
+class TestSpeakerCache:
+    """Test selection of representative speaker lines."""
+    
+    def test_empty_cache_has_no_context(self):
+        """Test that nothing is sent before any lines were transcribed."""
+        assert SpeakerCache().build_context() == ""
+    
+    def test_keeps_longest_lines_per_speaker(self):
+        """Test that the longest statements of each speaker are kept in spoken order."""
+        cache = SpeakerCache(samples_per_speaker=2)
+        cache.add_lines([
+            TranscriptionLine(timestamp=0.0, speaker="Alice", text="Long opening remarks"),
+            TranscriptionLine(timestamp=20.0, speaker="Bob", text="Yes"),
+            TranscriptionLine(timestamp=21.0, speaker="Alice", text="Okay"),
+            TranscriptionLine(timestamp=22.0, speaker="Bob", text="A longer answer"),
+            TranscriptionLine(timestamp=40.0, speaker="Alice", text="Closing thoughts"),
+            TranscriptionLine(timestamp=55.0, speaker="Bob", text="Thanks for having me here"),
+        ])
+        
+        assert cache.build_context() == "\n".join([
+            "Alice: Long opening remarks",
+            "Alice: Closing thoughts",
+            "Bob: A longer answer",
+            "Bob: Thanks for having me here",
+        ])
+    
+    def test_skips_repeated_context_lines(self):
+        """Test that lines repeated from the previous chunk's context are not added twice."""
+        cache = SpeakerCache(samples_per_speaker=3)
+        first_chunk = [
+            TranscriptionLine(timestamp=530.0, speaker="Alice", text="Before context"),
+            TranscriptionLine(timestamp=550.0, speaker="Alice", text="Context line"),
+        ]
+        second_chunk = [
+            TranscriptionLine(timestamp=550.0, speaker="Alice", text="Context line"),
+            TranscriptionLine(timestamp=580.0, speaker="Alice", text="New line"),
+        ]
+        
+        cache.add_lines(first_chunk)
+        cache.add_lines(second_chunk)
+        
+        assert cache.build_context() == "Alice: Before context\nAlice: Context line\nAlice: New line"
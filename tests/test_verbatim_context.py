@@ -1,7 +1,10 @@
 """Tests for verbatim context repetition and deduplication."""
 
+import asyncio
+import base64
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from typing import List
 
 from src.llm_transcribe.llm_client import LLMClient
@@ -48,6 +51,133 @@ class TestVerbatimContextRepetition:
         assert "verbatim" not in user_message
         assert "Context from previous chunk" not in user_message
     
+    def test_create_messages_includes_speaker_samples(self):
+        """Test that speaker samples are added ahead of the context prompt."""
+        client = LLMClient()
+        
+        context = "[00:09:30] Alice: Context line"
+        messages = client.create_messages(b"audio", 540.0, context, speaker_context="Bob: Earlier statement")
+        
+        user_message = messages[1]["content"][0]["text"]
+        assert "Bob: Earlier statement" in user_message
+        assert "do not repeat them" in user_message
+        assert user_message.index("Bob: Earlier statement") < user_message.index("Context from previous chunk")
+        assert "[00:30] Alice: Context line" in user_message
+    
+    def test_create_messages_embeds_audio_as_base64_data_url(self):
+        """Test that audio bytes round-trip through the base64 data URL."""
+        client = LLMClient()
+        
+        audio_bytes = bytes(range(256)) * 3
+        messages = client.create_messages(audio_bytes, 0.0, None)
+        
+        file_data = messages[1]["content"][1]["file"]["file_data"]
+        prefix, payload = file_data.split(",", 1)
+        
+        assert prefix == "data:audio/wav;base64"
+        assert "\n" not in payload
+        assert base64.b64decode(payload) == audio_bytes
+    
+    def test_create_messages_references_uploaded_audio(self):
+        """Test that uploaded audio is referenced by URI instead of inlined."""
+        client = LLMClient()
+        
+        file_uri = "https://generativelanguage.googleapis.com/v1beta/files/abc123"
+        messages = client.create_messages(b"audio", 0.0, None, None, file_uri)
+        
+        assert messages[1]["content"][1]["file"] == {"file_id": file_uri, "format": "audio/wav"}
+    
+    def test_transcribe_chunk_uploads_audio_once(self):
+        """Test that chunk audio is uploaded once and the URI reused on later requests."""
+        client = LLMClient(upload_audio=True)
+        chunk = ChunkData(start_time_seconds=0.0, end_time_seconds=600.0, chunk_index=0)
+        
+        uploaded = Mock(id="https://generativelanguage.googleapis.com/v1beta/files/abc123")
+        with patch('src.llm_transcribe.llm_client.litellm.create_file', return_value=uploaded) as create_file, \
+             patch.object(client, '_make_llm_call_with_retry', return_value="[00:01] Alice: Hi") as llm_call:
+            client.transcribe_chunk(chunk, b"audio")
+            result = client.transcribe_chunk(chunk, b"audio")
+        
+        create_file.assert_called_once()
+        assert chunk.uploaded_file_id == uploaded.id
+        messages = llm_call.call_args.args[0]
+        assert messages[1]["content"][1]["file"]["file_id"] == uploaded.id
+        assert result.lines[0].speaker == "Alice"
+    
+    def test_identical_audio_is_uploaded_once(self):
+        """Test that chunks with identical audio share one upload."""
+        client = LLMClient(upload_audio=True)
+        first = ChunkData(start_time_seconds=0.0, end_time_seconds=600.0, chunk_index=0)
+        second = ChunkData(start_time_seconds=0.0, end_time_seconds=600.0, chunk_index=0)
+        other = ChunkData(start_time_seconds=540.0, end_time_seconds=1140.0, chunk_index=1)
+        
+        uploads = [Mock(id="files/first"), Mock(id="files/other")]
+        with patch('src.llm_transcribe.llm_client.litellm.create_file', side_effect=uploads) as create_file, \
+             patch.object(client, '_make_llm_call_with_retry', return_value="[00:01] Alice: Hi"):
+            client.transcribe_chunk(first, b"same audio")
+            client.transcribe_chunk(second, b"same audio")
+            client.transcribe_chunk(other, b"other audio")
+        
+        assert create_file.call_count == 2
+        assert second.uploaded_file_id == "files/first"
+        assert other.uploaded_file_id == "files/other"
+    
+    def test_transcribe_chunk_falls_back_to_inline_audio(self):
+        """Test that a failed upload still sends the audio inline."""
+        client = LLMClient(upload_audio=True)
+        chunk = ChunkData(start_time_seconds=0.0, end_time_seconds=600.0, chunk_index=0)
+        
+        with patch('src.llm_transcribe.llm_client.litellm.create_file', side_effect=RuntimeError("no key")), \
+             patch.object(client, '_make_llm_call_with_retry', return_value="[00:01] Alice: Hi") as llm_call:
+            client.transcribe_chunk(chunk, b"audio")
+        
+        assert chunk.uploaded_file_id is None
+        messages = llm_call.call_args.args[0]
+        assert messages[1]["content"][1]["file"]["file_data"].startswith("data:audio/wav;base64,")
+    
+    def test_atranscribe_chunk_uses_async_completion(self):
+        """Test that the async path sends the same request via acompletion."""
+        client = LLMClient()
+        chunk = ChunkData(start_time_seconds=540.0, end_time_seconds=1140.0, chunk_index=1)
+        
+        response = Mock(choices=[Mock(message=Mock(content="[00:30] Alice: Hello"))])
+        with patch('src.llm_transcribe.llm_client.acompletion', new=AsyncMock(return_value=response)) as acompletion, \
+             patch('src.llm_transcribe.llm_client.completion_cost', return_value=0.01):
+            result = asyncio.run(client.atranscribe_chunk(chunk, b"audio", None, "Weekly sync"))
+        
+        acompletion.assert_awaited_once()
+        assert acompletion.call_args.kwargs["temperature"] == 0.1
+        assert result.lines[0].timestamp == 570.0
+        assert result.lines[0].speaker == "Alice"
+        assert client.request_count == 1
+    
+    def test_atranscribe_chunk_waits_for_rate_limiter(self):
+        """Test that async requests take a token from the rate limiter first."""
+        client = LLMClient(requests_per_minute=60)
+        client.rate_limiter.acquire = AsyncMock()
+        chunk = ChunkData(start_time_seconds=0.0, end_time_seconds=600.0, chunk_index=0)
+        
+        response = Mock(choices=[Mock(message=Mock(content="[00:30] Alice: Hello"))])
+        with patch('src.llm_transcribe.llm_client.acompletion', new=AsyncMock(return_value=response)), \
+             patch('src.llm_transcribe.llm_client.completion_cost', return_value=0.0):
+            asyncio.run(client.atranscribe_chunk(chunk, b"audio"))
+        
+        client.rate_limiter.acquire.assert_awaited_once()
+    
+    def test_create_messages_reuses_system_message(self):
+        """Test that the system message is built once per meeting context."""
+        client = LLMClient()
+        
+        first = client.create_messages(b"audio", 0.0, None)
+        second = client.create_messages(b"audio", 540.0, "[00:09:30] Alice: Hi")
+        with_meeting = client.create_messages(b"audio", 0.0, None, "Quarterly review")
+        
+        assert first[0] is second[0]
+        assert first[0]["content"] == client.system_message
+        assert with_meeting[0] is not first[0]
+        assert with_meeting[0]["content"].endswith("improve transcription accuracy.")
+        assert "Quarterly review" in with_meeting[0]["content"]
+    
     def test_system_message_includes_verbatim_example(self):
         """Test that system message includes verbatim context example."""
         client = LLMClient()